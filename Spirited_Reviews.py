@@ -1,7 +1,11 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from utils import add_sidebar_logo, get_data, REVIEWER_COLS
+import math
+from utils import (add_sidebar_logo, filter_index, get_dataset, positions_in, refresh_button, show_image,
+                   striped_table, table_positions, table_window)
+from image_assets import variant_url
+from image_cache import GITHUB_BASE
+from search import search_index
+from tables import reviews_table
 
 st.set_page_config(
     page_title="Spirited Reviews",
@@ -94,97 +98,72 @@ st.markdown("""
 
 st.title("Spirited Reviews 🥃")
 
-df = get_data()
+dataset = get_dataset()
 
 # ── Sidebar controls ──────────────────────────────────────────────────────────
-if st.sidebar.button("🔄 Refresh Data"):
-    st.cache_data.clear()
-    del st.session_state["df"]
-    st.rerun()
+refresh_button()
 
 theme = st.sidebar.radio("Table theme", ["Dark", "Light"], horizontal=True)
 
-# ── Display table ─────────────────────────────────────────────────────────────
-active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
-reviewer_display = {c: c.capitalize() for c in active_reviewers}
-
-base_cols  = ["date", "link", "brand", "name", "avg", "score"]
-tail_cols  = ["age", "proof", "price", "type"]
-display_cols = base_cols + active_reviewers + tail_cols
-
-display_df = df[[c for c in display_cols if c in df.columns]].copy()
-display_df["date"] = display_df["date"].dt.strftime("%d %B %Y")
-
-# Rename to display-friendly headers
-rename_map = {
-    "date": "Date", "link": "Video Link", "brand": "Brand",
-    "name": "Whiskey Name", "avg": "Avg Score", "score": "Verdict",
-    "age": "Age", "proof": "Proof", "price": "Price ($)", "type": "Type",
-    **reviewer_display
+# Sorting and filtering happen on the server; only the visible page is sent
+SORT_KEYS = {
+    "Date": "date", "Avg Score": "avg", "Median Score": "median", "Brand": "brand",
+    "Whiskey Name": "name", "Age": "age", "Proof": "proof", "Price": "price",
 }
-display_df.rename(columns=rename_map, inplace=True)
-
-reviewer_display_names = [reviewer_display[c] for c in active_reviewers]
-
-if theme == "Dark":
-    odd_color  = "#1a1a1a"
-    even_color = "#2a2a2a"
-    hover_color = "#3a3020"
-else:
-    odd_color  = "#ffffff"
-    even_color = "#f2efe8"
-    hover_color = "#fdf3dc"
-
-display_df["Avg Score"] = pd.to_numeric(display_df["Avg Score"], errors="coerce")
-for col in reviewer_display_names + ["Proof"]:
-    if col in display_df.columns:
-        display_df[col] = pd.to_numeric(display_df[col], errors="coerce")
-
-# Compute median across active reviewer columns
-display_df["Median Score"] = display_df[reviewer_display_names].median(axis=1, skipna=True).round(1)
-
-# Insert Median Score right after Avg Score
-cols = list(display_df.columns)
-avg_idx = cols.index("Avg Score")
-cols.insert(avg_idx + 1, cols.pop(cols.index("Median Score")))
-display_df = display_df[cols]
-
-# ── Pre-format columns as strings so Streamlit never renders "None" ───────────
-# Numeric score columns → "6.5" or "—"
-for col in reviewer_display_names + ["Avg Score", "Median Score"]:
-    if col in display_df.columns:
-        display_df[col] = display_df[col].apply(
-            lambda x: f"{x:.1f}" if pd.notna(x) and x is not None else "—"
-        )
-
-# Age → "12 yr" or "NAS"
-display_df["Age"] = display_df["Age"].apply(
-    lambda x: f"{float(x):.0f} yr" if pd.notna(x) and x is not None else "NAS"
-)
-
-# Proof → "117.3" or "—"
-if "Proof" in display_df.columns:
-    display_df["Proof"] = display_df["Proof"].apply(
-        lambda x: f"{x:.1f}" if pd.notna(x) and x is not None else "—"
-    )
-
-# Price → "$45" or "—"
-display_df["Price ($)"] = display_df["Price ($)"].apply(
-    lambda x: f"${float(x):.0f}" if pd.notna(x) and x is not None else "—"
-)
-
-text_color = "#eeeeee" if theme == "Dark" else "#222222"
+sort_label = st.sidebar.selectbox("Sort by", list(SORT_KEYS))
+descending = st.sidebar.radio("Order", ["Descending", "Ascending"], horizontal=True) == "Descending"
+
+# Every filter resolves against the dataset's prebuilt FilterIndex
+filters = filter_index(dataset)
+criteria = {}
+
+type_option = st.sidebar.radio("Restrict to Type:", ["All Types"] + filters.options("type"), index=0)
+if type_option != "All Types":
+    criteria["type"] = [type_option]
+
+
+def range_filter(label, name, cast=float, step=None, whole=False):
+    """A slider over a range column; only narrows the rows once it's moved off the full range.
+
+    whole=True makes an integer slider, widened outward so fractional extremes stay inside it.
+    """
+    bounds = filters.bounds(name)
+    if bounds is None or bounds[0] == bounds[1]:
+        return
+    if whole:
+        low, high = math.floor(bounds[0]), math.ceil(bounds[1])
+    else:
+        low, high = cast(bounds[0]), cast(bounds[1])
+    picked = st.slider(label, min_value=low, max_value=high, value=(low, high), step=step, key=f"filter_{name}")
+    if picked != (low, high):
+        criteria[name] = picked
+
+
+with st.sidebar.expander("More filters"):
+    range_filter("Proof", "proof", step=0.1)
+    range_filter("Price ($)", "price", whole=True)
+    range_filter("Age (years, excludes NAS)", "age", whole=True)
+    range_filter("Date reviewed", "date", cast=lambda t: t.date())
+    labels = st.multiselect("Verdict", filters.options("score"), key="filter_score")
+    if labels:
+        criteria["score"] = labels
+    reviewers = st.multiselect("Scored by", filters.options("reviewer"), format_func=str.capitalize,
+                               key="filter_reviewer")
+    if reviewers:
+        criteria["reviewer"] = reviewers
 
-def color_rows(row):
-    color = odd_color if row.name % 2 == 0 else even_color
-    return [f"background-color: {color}; color: {text_color}"] * len(row)
+# ── Display table ─────────────────────────────────────────────────────────────
+display_table = reviews_table(dataset)
 
-reviewer_fmt = {}
+query = st.text_input("🔍 Search", placeholder="Brand or whiskey name, e.g. weller, eagle rare 10")
 
-styled = (
-    display_df.reset_index(drop=True).style
-    .apply(color_rows, axis=1)
-)
+positions = table_positions(dataset, SORT_KEYS[sort_label], ascending=not descending)
+for rows in (filters.select(criteria), search_index(dataset).search(query)):
+    if rows is not None:
+        positions = positions_in(positions, rows, len(dataset))
+start, stop = table_window("reviews", len(positions),
+                           inputs=(sort_label, descending, repr(sorted(criteria.items())), query))
+styled = striped_table(display_table.take(positions[start:stop]), theme)
 
 st.dataframe(
     styled,
@@ -198,8 +177,8 @@ st.dataframe(
 
 # ── Scoring key ───────────────────────────────────────────────────────────────
 with st.expander("📊 Scoring Key"):
-    st.image(
-        "https://github.com/tpfeeney/spirited-reviews/blob/main/Scoring_Sheet_Final.jpg?raw=true",
+    show_image(
+        variant_url("Scoring_Sheet_Final.jpg", 600) or f"{GITHUB_BASE}/Scoring_Sheet_Final.jpg?raw=true",
         caption="Spirited Reviews Scoring Guide",
         width=600
     )
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""Barrel picks from the sheet's "InProg" and "Released" tabs.
+
+Kept out of the Barrel Picks page so the boot warm-up can load it too.
+"""
+import streamlit as st
+import pandas as pd
+
+from data_sources import configured_source
+
+# Maps sheet column headers → internal field names used by the page's render_pick()
+COLUMN_MAP = {
+    "Distillery/Company": "distillery",
+    "Brand":              "brand",
+    "Distillate":         "distillate_info",
+    "Mashbill":           "mashbill",
+    "Proof":              "proof",
+    "Age":                "age",
+    "Pick Name":          "name",
+    "Pick Date":          "pick_date",
+    "Release Date":       "release_date",
+    "Pick Team":          "pick_team",
+    "Location":           "location",
+    "Nose":               "nose",
+    "Palate":             "palate",
+    "Mouthfeel":          "mouthfeel",
+    "Finish":             "finish",
+    "Video":              "video",
+    "Status":             "status",
+    "Details":            "description",
+    "Image File":         "image_file",
+    "Image file":         "image_file",
+}
+
+
+# ── Data loader ────────────────────────────────────────────────────────────────
+@st.cache_data(ttl=300, max_entries=2)
+def load_barrel_picks(version):
+    """version – source_version("barrel_picks"); the Refresh button bumps it to refetch."""
+    try:
+        dfs = []
+        for sheet_name, tab in [("InProg", "upcoming"), ("Released", "previous")]:
+            try:
+                # Sheet tab, local fixture, ... — see data_sources.py
+                df = configured_source("barrel_picks", tab=sheet_name).read_frame()
+                df.columns = df.columns.str.strip()
+                df.rename(columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns}, inplace=True)
+                df["_tab"] = tab
+                dfs.append(df)
+            except Exception:
+                pass
+        if not dfs:
+            st.error("Could not load any barrel picks tabs.")
+            return pd.DataFrame()
+        combined = pd.concat(dfs, ignore_index=True)
+        combined["status"] = combined["status"].astype(str).str.strip().str.lower()
+        if "name" in combined.columns:
+            combined = combined[combined["name"].astype(str).str.strip().replace("nan", "") != ""]
+        return combined
+    except Exception as e:
+        st.error(f"Could not load barrel picks data: {e}")
+        return pd.DataFrame()
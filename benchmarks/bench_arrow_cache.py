@@ -0,0 +1,60 @@
+"""Per-rerun serialization: pandas display table vs. the cached Arrow table.
+
+    python benchmarks/bench_arrow_cache.py
+
+"pandas" is what st.dataframe did on every rerun before: convert the display
+frame to Arrow and write the IPC bytes. "cached Arrow" takes the rows from the
+table utils.arrow_table() keeps per dataset version, so only the IPC write is
+left. Both the full table (as sent unstyled) and a 50-row page are timed.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from streamlit import dataframe_util
+
+from dataset import Dataset
+from synthetic import make_raw_csv
+from utils import arrow_table, clean_reviews, format_values, prepare_reviews
+
+SIZES = [10_000, 50_000]
+PAGE_SIZE = 50
+
+
+def display_table(df):
+    out = df[['date_label', 'link', 'brand', 'name', 'avg', 'median', 'score', 'age', 'proof', 'price', 'type']]
+    for col in ['avg', 'median', 'proof']:
+        out[col] = format_values(out[col], "{:.1f}")
+    return out.reset_index(drop=True)
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>7}  {'sent':<6} {'pandas':>9} {'cached Arrow':>13}")
+    for n in SIZES:
+        dataset = Dataset(prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n))))))
+        frame = display_table(dataset.view())
+        table = arrow_table(dataset, "table", display_table)
+        page = np.arange(PAGE_SIZE)
+
+        cases = [
+            ("all",  lambda: frame,                lambda: table),
+            ("page", lambda: frame.iloc[page],     lambda: table.take(page)),
+        ]
+        for label, pandas_rows, arrow_rows in cases:
+            before = best_of(lambda: dataframe_util.convert_pandas_df_to_arrow_bytes(pandas_rows()))
+            after = best_of(lambda: dataframe_util.convert_arrow_table_to_arrow_bytes(arrow_rows()))
+            print(f"{n:>7,}  {label:<6} {before * 1000:>6.2f} ms {after * 1000:>10.2f} ms")
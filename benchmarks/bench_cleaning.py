@@ -0,0 +1,75 @@
+"""Vectorized clean_reviews vs. the original row-by-row cleaning.
+
+    python benchmarks/bench_cleaning.py
+
+Checks that both produce identical frames, then times them on synthetic
+sheets of 10k, 100k and 1M rows.
+"""
+import io
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from synthetic import make_raw_csv
+from utils import REVIEWER_COLS, clean_reviews, score_label
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def legacy_clean_reviews(df):
+    """clean_reviews as it was before vectorizing: .apply over age and avg."""
+    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+
+    active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
+    df['avg'] = df[active_reviewers].apply(pd.to_numeric, errors='coerce').mean(axis=1, skipna=True).round(1)
+    df['score'] = df['avg'].apply(score_label)
+
+    def clean_age(val):
+        if val is None:
+            return np.nan
+        s = str(val).strip()
+        if s.upper() in ('NAS', '', 'NAN', 'NONE', 'N/A'):
+            return np.nan
+        s = re.sub(r'(?i)\s*years?\s*', '', s).strip()
+        try:
+            return float(s)
+        except ValueError:
+            return np.nan
+    df['age'] = df['age'].apply(clean_age)
+
+    df['price'] = (
+        df['price']
+        .astype(str)
+        .str.strip()
+        .str.replace(r'[\$,]', '', regex=True)
+        .replace({'nan': np.nan, '': np.nan})
+    )
+    df['price'] = pd.to_numeric(df['price'], errors='coerce')
+    return df
+
+
+def timed(fn, raw):
+    df = pd.read_csv(io.BytesIO(raw))
+    t0 = time.perf_counter()
+    out = fn(df)
+    return time.perf_counter() - t0, out
+
+
+def main():
+    print(f"{'rows':>10}  {'row-wise':>10}  {'vectorized':>10}  {'speedup':>8}")
+    for n in SIZES:
+        raw = make_raw_csv(n)
+        legacy_t, legacy = timed(legacy_clean_reviews, raw)
+        new_t, new = timed(clean_reviews, raw)
+        pd.testing.assert_frame_equal(legacy, new)
+        print(f"{n:>10,}  {legacy_t * 1000:7.0f} ms  {new_t * 1000:7.0f} ms  {legacy_t / new_t:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Cost of the derived-column layer per refresh vs. what pages paid per rerun.
+
+    python benchmarks/bench_derived.py
+
+"per rerun (before)" is the pages' old derivation work — to_numeric over the
+score columns, the main-table median, the guest average/median, proof_cat and
+date formatting — which ran on every rerun of every session. derive_columns
+now does it once per dataset version, and an unchanged refresh reuses the
+published Dataset outright.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from synthetic import make_raw_csv
+from utils import (GUEST_COLS, PROOF_BINS, PROOF_LABELS, REVIEWER_COLS, clean_reviews,
+                   derive_columns, published_reviews)
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+def pages_rerun(df):
+    """The derivations pages 1, 2, 8 and the main page each did on a rerun."""
+    df = df.copy(deep=False)
+    for c in REVIEWER_COLS + GUEST_COLS + ['avg', 'proof', 'price', 'age']:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors='coerce')
+    reviewers = [c for c in REVIEWER_COLS if c in df.columns]
+    guests = [c for c in GUEST_COLS if c in df.columns]
+    df[reviewers].median(axis=1, skipna=True).round(1)
+    df[guests].mean(axis=1, skipna=True).round(1)
+    df[guests].median(axis=1, skipna=True).round(1)
+    pd.cut(df['proof'], bins=PROOF_BINS, labels=PROOF_LABELS, right=True)
+    df['date'].dt.strftime("%d %B %Y")
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>8}  {'per rerun (before)':>18}  {'derive once':>12}")
+    for n in SIZES:
+        published = published_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n)))))
+        before = best_of(lambda: pages_rerun(published))
+        once = best_of(lambda: derive_columns(published.copy()))
+        print(f"{n:>8,}  {before * 1000:>15.1f} ms  {once * 1000:>9.1f} ms")
@@ -0,0 +1,68 @@
+"""Combined filters: prebuilt FilterIndex vs. chained boolean masks over the frame.
+
+    python benchmarks/bench_filters.py
+
+For growing catalogs, times the index build and then each filter combination
+both ways: select() on the index, and the page-style chain of df[...] masks.
+Row counts must agree.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from dataset import Dataset
+from synthetic import make_raw_csv
+from utils import clean_reviews, filter_index, prepare_reviews
+
+SIZES = [10_000, 100_000]
+COMBOS = {
+    "type":                    {"type": ["Rye"]},
+    "type + proof":            {"type": ["Bourbon"], "proof": (110, 130)},
+    "price + age + verdict":   {"price": (40, 80), "age": (10, 15), "score": ["Buy-It-Now!"]},
+    "reviewer + date":         {"reviewer": ["zach"], "date": ("2024-01-01", "2024-06-30")},
+    "everything":              {"type": ["Bourbon", "Rye"], "proof": (100, 120), "price": (20, 100),
+                                "age": (6, 12), "score": ["Weeknight Winner", "Dependently Delicious"],
+                                "reviewer": ["randy", "norm"], "date": ("2023-01-01", "2025-12-31")},
+}
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, result
+
+
+def chained(df, criteria):
+    for name, c in criteria.items():
+        if name in ("type", "score"):
+            df = df[df[name].isin(c)]
+        elif name == "reviewer":
+            df = df[df[c].notna().any(axis=1)]
+        elif name == "date":
+            df = df[df[name].between(pd.Timestamp(c[0]), pd.Timestamp(c[1]))]
+        else:
+            df = df[df[name].between(*c).fillna(False).astype(bool)]
+    return df
+
+
+if __name__ == "__main__":
+    for n in SIZES:
+        dataset = Dataset(prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n))))))
+        df = dataset.view()
+        build, index = best_of(lambda: filter_index(Dataset(df)), repeat=1)
+        print(f"\n{n:,} rows — index built in {build * 1000:.0f} ms")
+        print(f"{'filters':<24}  {'index':>9}  {'masks':>9}  {'rows':>6}")
+        for label, criteria in COMBOS.items():
+            t_index, rows = best_of(lambda: index.select(criteria))
+            t_masks, masked = best_of(lambda: chained(df, criteria))
+            assert np.array_equal(rows, df.index.get_indexer(masked.index)), label
+            print(f"{label:<24}  {t_index * 1000:>6.2f} ms  {t_masks * 1000:>6.2f} ms  {len(rows):>6}")
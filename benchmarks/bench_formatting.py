@@ -0,0 +1,63 @@
+"""Per-cell lambda formatting vs. utils.format_values for the main table.
+
+    python benchmarks/bench_formatting.py
+
+Formats the score, age, proof and price columns the way Spirited_Reviews.py
+used to (one Python call per cell) and with format_values, checks the
+strings match, and times both. A theme-only rerun now reads the table from
+the Dataset memo, so its cost is the "memo hit" column.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from dataset import Dataset
+from synthetic import make_raw_csv
+from utils import REVIEWER_COLS, format_values, prepare_reviews, clean_reviews
+
+SIZES = [10_000, 100_000]
+SCORE_COLS = REVIEWER_COLS + ['avg', 'median', 'proof']
+
+
+def legacy_format(df):
+    out = {}
+    for col in SCORE_COLS:
+        out[col] = df[col].apply(lambda x: f"{x:.1f}" if pd.notna(x) and x is not None else "—")
+    out['age'] = df['age'].apply(lambda x: f"{float(x):.0f} yr" if pd.notna(x) and x is not None else "NAS")
+    out['price'] = df['price'].apply(lambda x: f"${float(x):.0f}" if pd.notna(x) and x is not None else "—")
+    return pd.DataFrame(out)
+
+
+def vectorized_format(df):
+    out = {col: format_values(df[col], "{:.1f}") for col in SCORE_COLS}
+    out['age'] = format_values(df['age'], "{:.0f} yr", missing="NAS")
+    out['price'] = format_values(df['price'], "${:.0f}")
+    return pd.DataFrame(out)
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return min(times)
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>8}  {'per-cell':>10}  {'vectorized':>10}  {'memo hit':>10}")
+    for n in SIZES:
+        df = prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n)))))
+        pd.testing.assert_frame_equal(legacy_format(df), vectorized_format(df), check_dtype=False)
+
+        dataset = Dataset(df)
+        dataset.memo("table", vectorized_format)
+        legacy = best_of(lambda: legacy_format(df))
+        vectorized = best_of(lambda: vectorized_format(df))
+        hit = best_of(lambda: dataset.memo("table", vectorized_format))
+        print(f"{n:>8,}  {legacy * 1000:>7.1f} ms  {vectorized * 1000:>7.1f} ms  {hit * 1e6:>7.1f} µs")
@@ -0,0 +1,75 @@
+"""Image loading per page view: uncached fetches vs the shared image cache.
+
+    python benchmarks/bench_image_cache.py [delay-seconds]
+
+Images come from a local stand-in for GitHub that waits `delay` seconds per
+request (see fake_github.py). "uncached" fetches every image on every view,
+as the pages used to. "cold" is the first view through image_cache.
+"memory" is a repeat view. "disk" is a repeat view in a fresh process,
+simulated by dropping the memory LRU, the loaded index and the
+resolution memo.
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import image_cache  # noqa: E402
+from fake_github import FakeGitHub  # noqa: E402
+from singleflight import http_get  # noqa: E402
+
+DEFAULT_DELAY = 0.1
+# One About view plus one Barrel Picks view; stogie.jpg is only in the repo as .jpeg,
+# and the upcoming pick's label hasn't been uploaded yet
+VIEW = ["Randy.png", "Norm.png", "Zach.png", "peerless_rye.png", "stogie.jpg", "upcoming_pick.jpg"]
+
+
+def uncached_view():
+    for filename in VIEW:
+        for name in image_cache.image_names(filename):
+            if http_get(f"{image_cache.GITHUB_BASE}/{name}?raw=true").status_code == 200:
+                break
+
+
+def cached_view():
+    for filename in VIEW:
+        image_cache.load_image(filename)
+
+
+def forget_memory():
+    image_cache._memory.clear()
+    image_cache._memory_bytes = 0
+    image_cache._index = None
+    image_cache.forget_resolutions()
+
+
+def timed(gh, fn):
+    before = gh.requests
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0, gh.requests - before
+
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DELAY
+    image_cache.IMAGE_CACHE_DIR = tempfile.mkdtemp(prefix="spirited-bench-images-")
+    image_cache.INDEX_PATH = os.path.join(image_cache.IMAGE_CACHE_DIR, "index.json")
+
+    with FakeGitHub(delay=delay) as gh:
+        image_cache.GITHUB_BASE = gh.base
+        rows = [("uncached", timed(gh, uncached_view)), ("cold", timed(gh, cached_view)),
+                ("memory", timed(gh, cached_view))]
+        forget_memory()
+        rows.append(("disk", timed(gh, cached_view)))
+
+    print(f"{len(VIEW)} images, {delay * 1000:.0f} ms per request")
+    print(f"{'view':>10}  {'time':>10}  {'requests':>8}")
+    for label, (seconds, requests) in rows:
+        print(f"{label:>10}  {seconds * 1000:7.1f} ms  {requests:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Cold page views: images fetched one after another vs concurrently.
+
+    python benchmarks/bench_image_fetch.py [delay-seconds]
+
+Images come from a local stand-in for GitHub that waits `delay` seconds per
+request (see fake_github.py). Every run starts from an empty image cache.
+"sequential" calls load_image per image, as the render loops used to.
+The other rows call load_images with that many workers, as the pages now
+do before drawing.
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import image_cache  # noqa: E402
+from fake_github import FakeGitHub  # noqa: E402
+
+DEFAULT_DELAY = 0.2
+WORKERS = [2, 4, 8]
+# The crew photos plus the pick labels, as on a cold About and Barrel Picks view
+VIEWS = {
+    "About": ["Randy.png", "Norm.png", "Zach.png"],
+    "Barrel Picks": ["peerless_rye.png", "stogie.jpeg", "king_kelvin.png", "kogac.png",
+                     "boggs.png", "snw.png", "shortb.jpg", "irishkelvin.jpg"],
+}
+
+
+def cold(fn):
+    image_cache.IMAGE_CACHE_DIR = tempfile.mkdtemp(prefix="spirited-bench-images-")
+    image_cache.INDEX_PATH = os.path.join(image_cache.IMAGE_CACHE_DIR, "index.json")
+    image_cache._memory.clear()
+    image_cache._memory_bytes = 0
+    image_cache._index = None
+    image_cache.forget_resolutions()
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main():
+    delay = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DELAY
+    with FakeGitHub(delay=delay) as gh:
+        image_cache.GITHUB_BASE = gh.base
+        print(f"{delay * 1000:.0f} ms per request")
+        print(f"{'page':<14} {'images':>6} {'sequential':>11}" + "".join(f" {f'{w} workers':>10}" for w in WORKERS))
+        for page, names in VIEWS.items():
+            seq = cold(lambda: [image_cache.load_image(n) for n in names])
+            par = [cold(lambda: image_cache.load_images(names, max_workers=w)) for w in WORKERS]
+            print(f"{page:<14} {len(names):>6} {seq * 1000:8.0f} ms" + "".join(f" {t * 1000:7.0f} ms" for t in par))
+
+
+if __name__ == "__main__":
+    main()
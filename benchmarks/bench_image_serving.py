@@ -0,0 +1,72 @@
+"""Server-side image work per page view: st.image on the originals vs static URLs.
+
+    python image_assets.py && python benchmarks/bench_image_serving.py
+
+"before" replays what the About and Barrel Picks pages used to do on every
+view: decode the file with PIL and hand the image to st.image, which
+re-encodes it as PNG/JPEG (resizing it if wider than the content). The logo
+and scoring sheet were linked from GitHub at full size. With static serving
+on, every page hands the browser a /app/static/ URL instead. The process
+does no image work, and the browser downloads the variant once, then keeps
+it (see server.py's Cache-Control).
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from PIL import Image  # noqa: E402
+from streamlit.elements.lib.image_utils import (  # noqa: E402
+    _ensure_image_size_and_format, _pil_to_bytes, _validate_image_format_string,
+)
+from streamlit.elements.lib.layout_utils import LayoutConfig  # noqa: E402
+
+from image_assets import manifest, pick_variant  # noqa: E402
+
+REPEATS = 3
+# (page, CSS width, images on one view) that went through PIL + st.image
+VIEWS = [
+    ("About", 240, ["Randy.png", "Norm.png", "Zach.png"]),
+    ("Barrel Picks", 480, ["peerless_rye.png", "stogie.jpeg"]),
+]
+# (label, image, CSS width) that were linked from GitHub as-is
+LINKED = [("logo", "srlogo.png", 150), ("scoring key", "Scoring_Sheet_Final.jpg", 600)]
+
+
+def st_image_cost(path):
+    """Seconds and bytes sent for PIL.Image.open + st.image on a file, best of REPEATS."""
+    best = None
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        img = Image.open(os.path.join(ROOT, path))
+        fmt = _validate_image_format_string(img, "auto")
+        out = _ensure_image_size_and_format(_pil_to_bytes(img, fmt), LayoutConfig(width="stretch"), fmt)
+        t = time.perf_counter() - t0
+        best = t if best is None else min(best, t)
+    return best, len(out)
+
+
+def main():
+    images = manifest()["images"]
+    if not images:
+        sys.exit("No manifest; run `python image_assets.py` first.")
+
+    print(f"{'view':<14} {'before CPU':>13} {'before sent':>14} {'static CPU':>11} {'static sent':>12}")
+    for page, width, names in VIEWS:
+        cpu = sent = static_sent = 0
+        for name in names:
+            t, n = st_image_cost(name)
+            cpu += t
+            sent += n
+            static_sent += pick_variant(images[name], width)["bytes"]
+        print(f"{page:<14} {cpu * 1000:10.0f} ms {sent / 1024:11.0f} KB {0:8.0f} ms {static_sent / 1024:9.0f} KB")
+
+    for label, name, width in LINKED:
+        print(f"{label:<14} {'—':>13} {images[name]['bytes'] / 1024:11.0f} KB {0:8.0f} ms "
+              f"{pick_variant(images[name], width)['bytes'] / 1024:9.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Image bytes per page view: the originals vs the variants the pages pick.
+
+    python image_assets.py && python benchmarks/bench_image_variants.py
+
+Reads static/img/manifest.json. Each page's images are looked up at the
+width the page asks for (CREW_IMAGE_WIDTH, PICK_IMAGE_WIDTH), just as
+variant_url() does when the page renders. Originals are counted at their
+file size; st.image used to re-encode them, to roughly the same size.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from image_assets import manifest, pick_variant  # noqa: E402
+
+# (page, CSS width, images shown on one view)
+VIEWS = [
+    ("About", 240, ["Randy.png", "Norm.png", "Zach.png"]),
+    ("Barrel Picks", 480, ["peerless_rye.png", "stogie.jpeg"]),
+]
+
+
+def main():
+    images = manifest()["images"]
+    if not images:
+        sys.exit("No manifest; run `python image_assets.py` first.")
+
+    print(f"{'page':<14} {'image':<20} {'original':>10} {'variant':>14} {'ratio':>7}")
+    for page, width, names in VIEWS:
+        total_src = total_out = 0
+        for name in names:
+            entry = images[name]
+            variant = pick_variant(entry, width)
+            total_src += entry["bytes"]
+            total_out += variant["bytes"]
+            print(f"{page:<14} {name:<20} {entry['bytes'] / 1024:>7.0f} KB "
+                  f"{variant['bytes'] / 1024:>6.0f} KB @{variant['width']:<4} "
+                  f"{entry['bytes'] / variant['bytes']:>6.1f}x")
+        print(f"{page:<14} {'(per view)':<20} {total_src / 1024:>7.0f} KB "
+              f"{total_out / 1024:>6.0f} KB {'':5} {total_src / total_out:>6.1f}x\n")
+
+
+if __name__ == "__main__":
+    main()
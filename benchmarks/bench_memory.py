@@ -0,0 +1,45 @@
+"""Memory footprint of the published reviews frame, before and after apply_schema.
+
+    python benchmarks/bench_memory.py
+
+Reports deep memory usage per column group for the fixture sheet and for
+synthetic sheets of 1k, 10k and 100k rows.
+"""
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from synthetic import make_raw_csv
+from utils import apply_schema, clean_reviews, published_reviews
+
+SIZES = [1_000, 10_000, 100_000]
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "reviews.csv")
+
+
+def _mb(n):
+    return n / 1024 / 1024
+
+
+def report(label, raw):
+    plain = published_reviews(clean_reviews(raw))
+    compact = apply_schema(plain.copy())
+    before = plain.memory_usage(deep=True, index=False)
+    after = compact.memory_usage(deep=True, index=False)
+
+    print(f"{label}: {len(plain):,} rows  "
+          f"{_mb(before.sum()):8.2f} MB → {_mb(after.sum()):8.2f} MB  "
+          f"({after.sum() / before.sum():.0%})")
+    widest = before.sort_values(ascending=False).index[:6]
+    for col in widest:
+        print(f"    {col:<12} {str(plain[col].dtype):<16} {_mb(before[col]):7.2f} MB → "
+              f"{str(compact[col].dtype):<16} {_mb(after[col]):7.2f} MB")
+
+
+if __name__ == "__main__":
+    report("fixture", pd.read_csv(FIXTURE))
+    for n in SIZES:
+        report(f"{n:>7,}", pd.read_csv(io.BytesIO(make_raw_csv(n))))
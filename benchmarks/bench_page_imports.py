@@ -0,0 +1,76 @@
+"""First render of every page in a fresh interpreter, and which heavy libraries it loaded.
+
+    python benchmarks/bench_page_imports.py [git-rev]
+
+Each page runs once, in its own process, against the offline fixtures, with
+streamlit, pandas and utils already imported. What's timed is what a new
+server process pays on a page's first render: its own imports plus its
+default branch. Pass a revision (e.g. HEAD~1) to run that tree side by side.
+"""
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY = ["matplotlib", "seaborn", "plotly", "scipy", "sklearn", "statsmodels"]
+
+_CHILD = """
+import json, sys, time
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+import utils
+utils.load_dataset()
+before = set(sys.modules)
+t = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+seconds = time.perf_counter() - t
+loaded = {m.split(".")[0] for m in set(sys.modules) - before}
+print(json.dumps({"seconds": seconds, "error": bool(at.exception), "loaded": sorted(loaded & set(sys.argv[2:]))}))
+"""
+
+
+def pages(root):
+    return ["Spirited_Reviews.py"] + sorted(
+        os.path.join("pages", p) for p in os.listdir(os.path.join(root, "pages")) if p.endswith(".py")
+    )
+
+
+def export(rev):
+    """Check out `rev` into a temporary directory with git archive."""
+    target = tempfile.mkdtemp(prefix="spirited-rev-")
+    archive = subprocess.run(["git", "archive", rev], cwd=ROOT, capture_output=True, check=True).stdout
+    with tempfile.TemporaryFile() as f:
+        f.write(archive)
+        f.seek(0)
+        tarfile.open(fileobj=f).extractall(target)
+    return target
+
+
+def first_render(root, page, cache_dir):
+    env = {**os.environ, "SPIRITED_OFFLINE": "1", "SPIRITED_CACHE_DIR": cache_dir}
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, page, *HEAVY],
+        cwd=root, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    trees = {"current": ROOT}
+    if len(sys.argv) > 1:
+        trees = {sys.argv[1]: export(sys.argv[1]), **trees}
+
+    cache_dir = tempfile.mkdtemp(prefix="spirited-bench-")
+    first_render(ROOT, "Spirited_Reviews.py", cache_dir)     # write the snapshots once
+
+    for page in pages(ROOT):
+        print(page)
+        for label, root in trees.items():
+            r = first_render(root, page, cache_dir)
+            note = "  (raised)" if r["error"] else ""
+            print(f"  {label:<10} {r['seconds']:>6.2f} s  {', '.join(r['loaded']) or '-'}{note}")
@@ -0,0 +1,55 @@
+"""Search latency: prebuilt SearchIndex vs. scanning the frame with str.contains.
+
+    python benchmarks/bench_search.py
+
+Builds the index for growing catalogs, then times each query against both
+the index and a case-insensitive substring scan of brand and name. Row counts
+differ where they should: the index matches word prefixes ("12" isn't found
+inside "112") and forgives typos, which the scan can't.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from dataset import Dataset
+from search import search_index
+from synthetic import make_raw_csv
+from utils import clean_reviews, prepare_reviews
+
+SIZES = [10_000, 100_000]
+QUERIES = ["b", "buffalo", "bufalo trace", "single barrel 12", "batch 99", "weler"]
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t)
+    return best, result
+
+
+def scan(df, query):
+    text = df["brand"].astype(str) + " " + df["name"].astype(str)
+    hit = pd.Series(True, index=df.index)
+    for term in query.split():
+        hit &= text.str.contains(term, case=False, regex=False)
+    return hit.to_numpy().nonzero()[0]
+
+
+if __name__ == "__main__":
+    for n in SIZES:
+        dataset = Dataset(prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n))))))
+        df = dataset.view()
+        build, index = best_of(lambda: search_index(Dataset(df)), repeat=1)
+        print(f"\n{n:,} rows — index built in {build * 1000:.0f} ms")
+        print(f"{'query':<18}  {'index':>9}  {'rows':>6}  {'scan':>9}  {'rows':>6}")
+        for q in QUERIES:
+            t_index, rows = best_of(lambda: index.search(q))
+            t_scan, scanned = best_of(lambda: scan(df, q), repeat=2)
+            print(f"{q!r:<18}  {t_index * 1000:>6.2f} ms  {len(rows):>6}  {t_scan * 1000:>6.1f} ms  {len(scanned):>6}")
@@ -0,0 +1,80 @@
+"""Resident memory with 1, 50 and 200 sessions: per-session copies vs. the shared Dataset.
+
+    python benchmarks/bench_sessions.py [rows]
+
+Each measurement runs in a fresh interpreter. A simulated session holds what a
+real one would while a page is rendering:
+
+    copies  – its own deep copy of the frame (what st.cache_data handed every
+              session) plus the page's defensive .copy() of it
+    shared  – a reference to the one process-wide Dataset plus the page's view,
+              filtered by type with one derived column added, as page 2 does
+"""
+import io
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SESSIONS = [1, 50, 200]
+DEFAULT_ROWS = 20_000
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("VmRSS not available")
+
+
+def run(mode, sessions, rows):
+    import gc
+
+    import pandas as pd
+
+    from dataset import Dataset
+    from synthetic import make_raw_csv
+    from utils import apply_schema, clean_reviews, published_reviews
+
+    dataset = Dataset(apply_schema(published_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(rows)))))))
+    gc.collect()
+    baseline = rss_mb()
+
+    held = []
+    for _ in range(sessions):
+        if mode == "copies":
+            session_df = dataset.view().copy()
+            page_df = session_df.copy()
+        else:
+            session_df = dataset
+            page_df = session_df.view()
+            page_df = page_df[page_df["type"] == "Bourbon"]
+            page_df["age_new"] = pd.to_numeric(page_df["age"], errors="coerce")
+        held.append((session_df, page_df))
+    gc.collect()
+    return baseline, rss_mb()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        baseline, total = run(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]))
+        print(f"{baseline:.1f} {total:.1f}")
+        sys.exit()
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    env = {**os.environ, "SPIRITED_OFFLINE": "1"}
+    print(f"{rows:,}-row reviews frame; RSS above the single loaded dataset")
+    print(f"{'sessions':>8}  {'copies':>10}  {'shared':>10}")
+    for n in SESSIONS:
+        extra = {}
+        for mode in ("copies", "shared"):
+            out = subprocess.run(
+                [sys.executable, __file__, mode, str(n), str(rows)],
+                capture_output=True, text=True, check=True, env=env,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+            ).stdout.split()
+            extra[mode] = float(out[1]) - float(out[0])
+        print(f"{n:>8}  {extra['copies']:>8.1f}MB  {extra['shared']:>8.1f}MB")
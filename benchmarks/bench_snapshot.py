@@ -0,0 +1,53 @@
+"""Cold-start cost: CSV parse + clean vs. reading the Parquet snapshot.
+
+    python benchmarks/bench_snapshot.py [--network]
+
+--network also times a full fetch from the configured reviews source.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+import snapshot
+from synthetic import make_raw_csv
+from data_sources import configured_source
+from utils import clean_reviews, published_reviews
+
+SIZES = [1_000, 10_000, 100_000]
+REPEATS = 5
+
+
+def best_of(fn, repeats=REPEATS):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    snapshot.SNAPSHOT_DIR = tempfile.mkdtemp(prefix="spirited-bench-")
+
+    if "--network" in sys.argv:
+        t = best_of(lambda: clean_reviews(configured_source("reviews").read_frame()), repeats=3)
+        print(f"{'live source':>12}  fetch+parse+clean {t * 1000:9.1f} ms")
+
+    print(f"{'rows':>12}  {'csv parse+clean':>17}  {'snapshot read':>14}  {'speedup':>8}")
+    for n in SIZES:
+        raw = make_raw_csv(n)
+        snapshot.write_snapshot("bench", clean_reviews(pd.read_csv(io.BytesIO(raw))))
+
+        csv_t = best_of(lambda: published_reviews(clean_reviews(pd.read_csv(io.BytesIO(raw)))))
+        snap_t = best_of(lambda: published_reviews(snapshot.read_snapshot("bench")))
+        print(f"{n:>12,}  {csv_t * 1000:14.1f} ms  {snap_t * 1000:11.1f} ms  {csv_t / snap_t:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Read + clean cost of each data-source backend on the same synthetic sheet.
+
+    python benchmarks/bench_sources.py [--network]
+
+--network also times the configured Google Sheets source.
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_sources import configured_source, source_from_spec
+from synthetic import make_raw_reviews
+from utils import clean_reviews
+
+SIZES = [1_000, 10_000, 100_000]
+REPEATS = 5
+
+
+def best_of(fn, repeats=REPEATS):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def write_backends(raw, workdir):
+    """Write `raw` in every local format; return {label: spec}."""
+    csv_path = os.path.join(workdir, "reviews.csv")
+    parquet_path = os.path.join(workdir, "reviews.parquet")
+    sqlite_path = os.path.join(workdir, "reviews.db")
+
+    raw.to_csv(csv_path, index=False)
+    raw.to_parquet(parquet_path, index=False)
+    with sqlite3.connect(sqlite_path) as conn:
+        raw.to_sql("reviews", conn, if_exists="replace", index=False)
+
+    return {
+        "csv":     f"csv:{csv_path}",
+        "parquet": f"parquet:{parquet_path}",
+        "sqlite":  f"sqlite:{sqlite_path}#reviews",
+    }
+
+
+def main():
+    if "--network" in sys.argv:
+        source = configured_source("reviews")
+        t = best_of(lambda: clean_reviews(source.read_frame()), repeats=3)
+        print(f"{source.spec}: {t * 1000:.1f} ms (read + clean)\n")
+
+    print(f"{'rows':>10}  {'backend':>8}  {'read':>10}  {'read+clean':>11}")
+    for n in SIZES:
+        with tempfile.TemporaryDirectory() as workdir:
+            for label, spec in write_backends(make_raw_reviews(n), workdir).items():
+                source = source_from_spec(spec)
+                read_t = best_of(source.read_frame)
+                total_t = best_of(lambda: clean_reviews(source.read_frame()))
+                print(f"{n:>10,}  {label:>8}  {read_t * 1000:7.1f} ms  {total_t * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
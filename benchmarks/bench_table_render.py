@@ -0,0 +1,87 @@
+"""Render cost of the main table: row-wise Styler vs. precomputed stripes vs. unstyled.
+
+    python benchmarks/bench_table_render.py
+
+Marshals the table the way st.dataframe does (Styler → ArrowData proto,
+frame → Arrow bytes) and reports build time, marshal time and payload size
+at 1k and 5k rows. Also checks the precomputed stripes produce exactly the
+CSS the old color_rows did.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from streamlit import dataframe_util
+from streamlit.elements.lib.pandas_styler_utils import marshall_styler
+from streamlit.proto.ArrowData_pb2 import ArrowData
+
+import utils
+from synthetic import make_raw_csv
+from utils import TABLE_THEMES, format_values, prepare_reviews, clean_reviews, striped_table
+
+SIZES = [1_000, 5_000]
+COLUMNS = ['date_label', 'link', 'brand', 'name', 'avg', 'median', 'score',
+           'randy', 'norm', 'zach', 'age', 'proof', 'price', 'type']
+
+
+def legacy_styler(df, theme):
+    colors = TABLE_THEMES[theme]
+
+    def color_rows(row):
+        color = colors["odd"] if row.name % 2 == 0 else colors["even"]
+        return [f"background-color: {color}; color: {colors['text']}"] * len(row)
+
+    return df.style.apply(color_rows, axis=1)
+
+
+def precomputed_styler(df, theme):
+    limit, utils.STRIPE_ROW_LIMIT = utils.STRIPE_ROW_LIMIT, len(df)
+    try:
+        return striped_table(df, theme)
+    finally:
+        utils.STRIPE_ROW_LIMIT = limit
+
+
+def marshal(data):
+    proto = ArrowData()
+    frame = data
+    if not isinstance(data, pd.DataFrame):
+        data.set_uuid("bench")
+        marshall_styler(proto, data, "bench")
+        frame = data.data
+    proto.data = dataframe_util.convert_pandas_df_to_arrow_bytes(frame)
+    return proto
+
+
+def timed(fn):
+    t = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t
+
+
+def table(n):
+    df = prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n)))))
+    df = df[COLUMNS].reset_index(drop=True)
+    for col in ['avg', 'median', 'randy', 'norm', 'zach', 'proof']:
+        df[col] = format_values(df[col], "{:.1f}")
+    return df
+
+
+if __name__ == "__main__":
+    small = table(50)
+    assert marshal(legacy_styler(small, "Dark")).styler.styles == marshal(precomputed_styler(small, "Dark")).styler.styles
+
+    paths = [("row-wise Styler", legacy_styler), ("precomputed", precomputed_styler),
+             ("unstyled", lambda df, theme: df)]
+    print(f"{'rows':>6}  {'path':<16} {'build':>9} {'marshal':>10} {'payload':>10}")
+    for n in SIZES:
+        df = table(n)
+        for name, make in paths:
+            styled, build = timed(lambda: make(df, "Dark"))
+            proto, render = timed(lambda: marshal(styled))
+            print(f"{n:>6,}  {name:<16} {build * 1000:>6.1f} ms {render * 1000:>7.1f} ms "
+                  f"{proto.ByteSize() / 1024:>7.0f} KB")
@@ -0,0 +1,54 @@
+"""Payload of the main table: whole catalog vs. one server-side page.
+
+    python benchmarks/bench_table_window.py
+
+Builds the formatted table for growing catalogs and compares the Arrow bytes
+st.dataframe would send for every row against one 50-row page sorted by a
+cached table_positions() order, narrowed to bourbons through the filter index
+as the main page does, along with the per-rerun time to cut the page.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from streamlit import dataframe_util
+
+from dataset import Dataset
+from synthetic import make_raw_csv
+from utils import clean_reviews, filter_index, format_values, positions_in, prepare_reviews, table_positions
+
+SIZES = [1_000, 10_000, 50_000]
+PAGE_SIZE = 50
+
+
+def display_table(df):
+    out = df[['date_label', 'link', 'brand', 'name', 'avg', 'median', 'score', 'age', 'proof', 'price', 'type']]
+    for col in ['avg', 'median', 'proof']:
+        out[col] = format_values(out[col], "{:.1f}")
+    return out.reset_index(drop=True)
+
+
+def arrow_bytes(df):
+    return len(dataframe_util.convert_pandas_df_to_arrow_bytes(df))
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>7}  {'full table':>11}  {'one page':>9}  {'cut page':>9}")
+    for n in SIZES:
+        dataset = Dataset(prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(n))))))
+        table = dataset.memo("table", display_table)
+        table_positions(dataset, "avg", ascending=False)
+        filters = filter_index(dataset)
+
+        t = time.perf_counter()
+        positions = table_positions(dataset, "avg", ascending=False)
+        positions = positions_in(positions, filters.select({"type": ["Bourbon"]}), len(dataset))
+        page = table.take(positions[:PAGE_SIZE]).reset_index(drop=True)
+        cut = time.perf_counter() - t
+
+        print(f"{n:>7,}  {arrow_bytes(table) / 1024:>8.0f} KB  {arrow_bytes(page) / 1024:>6.0f} KB  "
+              f"{cut * 1000:>6.2f} ms")
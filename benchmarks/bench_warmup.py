@@ -0,0 +1,66 @@
+"""First page render in a new server process, with and without the boot warm-up.
+
+    python benchmarks/bench_warmup.py [rows]
+
+Each page runs once in a fresh interpreter against a synthetic reviews CSV.
+"cold" renders straight away, as the first visitor after a restart did.
+"warm" runs warmup.start() and waits for it first, as server.py does before
+/ready lets traffic in. The warm-up's own duration is shown alongside.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_ROWS = 20_000
+PAGES = ["Spirited_Reviews.py", "pages/3_Distillery_Ranks.py", "pages/6_Barrel_Picks.py",
+         "pages/8_Spirited_Guests.py"]
+
+_CHILD = """
+import json, sys, time
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+warmup_seconds = None
+if sys.argv[2] == "warm":
+    import warmup
+    t = time.perf_counter()
+    warmup.start()
+    warmup.wait()
+    warmup_seconds = time.perf_counter() - t
+t = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300)
+at.run()
+print(json.dumps({"seconds": time.perf_counter() - t, "warmup": warmup_seconds, "error": bool(at.exception)}))
+"""
+
+
+def first_render(page, mode, env):
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, page, mode], cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    from synthetic import make_raw_csv
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    work = tempfile.mkdtemp(prefix="spirited-warmup-")
+    csv = os.path.join(work, "reviews.csv")
+    with open(csv, "wb") as f:
+        f.write(make_raw_csv(rows))
+
+    print(f"{rows:,}-row reviews sheet; each run starts with an empty cache directory")
+    print(f"{'page':<32}  {'cold':>8}  {'warm':>8}  {'warm-up':>8}")
+    for i, page in enumerate(PAGES):
+        result = {}
+        for mode in ("cold", "warm"):
+            env = {**os.environ, "SPIRITED_OFFLINE": "1", "SPIRITED_REVIEWS_SOURCE": f"csv:{csv}",
+                   "SPIRITED_CACHE_DIR": tempfile.mkdtemp(dir=work)}
+            result[mode] = first_render(page, mode, env)
+        print(f"{page:<32}  {result['cold']['seconds']:>6.2f} s  {result['warm']['seconds']:>6.2f} s  "
+              f"{result['warm']['warmup']:>6.2f} s")
@@ -0,0 +1,72 @@
+"""Fails if any page mutates the shared, read-only reviews dataset.
+
+    python benchmarks/check_shared_dataset.py
+
+Runs every page against the offline fixtures in this process, so they all
+share one Dataset, and compares the shared frame's content hash, columns and
+dtypes before and after. Exits non-zero if anything changed.
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("SPIRITED_OFFLINE", "1")
+os.environ.setdefault("SPIRITED_CACHE_DIR", tempfile.mkdtemp(prefix="spirited-check-"))
+
+from streamlit.testing.v1 import AppTest
+
+from sheet_sync import frame_digest
+from utils import load_dataset
+
+PAGES = ["Spirited_Reviews.py"] + sorted(
+    os.path.join("pages", p) for p in os.listdir(os.path.join(ROOT, "pages")) if p.endswith(".py")
+)
+
+
+def fingerprint(dataset):
+    frame = dataset.view()
+    return frame_digest(frame), list(frame.columns), [str(t) for t in frame.dtypes]
+
+
+def check_views_are_isolated(dataset):
+    """Writing to a view — new column, converted column, single cell — must not reach the shared frame."""
+    view = dataset.view()
+    view["scratch"] = 1
+    view["avg"] = view["avg"].astype(float) * 2
+    view.loc[0, "brand"] = view.loc[len(view) - 1, "brand"]
+    view.sort_values("avg", inplace=True)
+
+
+def main():
+    dataset = load_dataset()
+    before = fingerprint(dataset)
+    failures = []
+
+    check_views_are_isolated(dataset)
+    if fingerprint(dataset) != before:
+        failures.append("writing to a view changed the shared frame")
+
+    for page in PAGES:
+        at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=60)
+        at.run()
+        problem = None
+        if at.exception:
+            problem = f"raised {at.exception[0].value}"
+        elif load_dataset() is not dataset:
+            problem = "replaced the shared dataset"
+        elif fingerprint(dataset) != before:
+            problem = "mutated the shared dataset"
+            before = fingerprint(dataset)
+        if problem:
+            failures.append(f"{page} {problem}")
+        print(f"{page:<45} {'FAIL' if problem else 'ok'}")
+
+    for failure in failures:
+        print("FAIL:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""Checks that derived caches follow the content hash of the published frame.
+
+    python benchmarks/check_versioning.py [rows]
+
+Builds the search index, filter index and a display table on one Dataset,
+then publishes again three ways and times the same lookups:
+
+    identical   – a fresh copy of the same frame, as after an unchanged refetch
+                  or a day rollover that publishes nothing new: every cache is warm
+    changed     – the same frame with one score edited: every cache is rebuilt
+    reverted    – the original frame again: warm, as the previous version's
+                  memos are still kept
+
+Exits non-zero if a case lands on the wrong side.
+"""
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from dataset import Dataset
+from search import search_index
+from synthetic import make_raw_csv
+from utils import arrow_table, clean_reviews, filter_index, prepare_reviews
+
+DEFAULT_ROWS = 20_000
+
+
+def warm_up(dataset):
+    """Seconds to fetch every derived cache the app builds on publish."""
+    t = time.perf_counter()
+    search_index(dataset)
+    filter_index(dataset)
+    arrow_table(dataset, "bench", lambda df: df[["brand", "name", "avg"]])
+    return time.perf_counter() - t
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    frame = prepare_reviews(clean_reviews(pd.read_csv(io.BytesIO(make_raw_csv(rows)))))
+    edited = frame.copy()
+    edited.loc[0, "avg"] = edited.loc[0, "avg"] + 0.5
+
+    first = Dataset.from_frame(frame)
+    cold = warm_up(first)
+    print(f"{rows:,} rows — first build {cold * 1000:.0f} ms")
+
+    failures = 0
+    for label, next_frame, expect_warm in [
+        ("identical", frame.copy(), True),
+        ("changed", edited, False),
+        ("reverted", frame.copy(), True),
+    ]:
+        dataset = Dataset.from_frame(next_frame)
+        seconds = warm_up(dataset)
+        warm = seconds < cold / 10
+        ok = warm == expect_warm
+        failures += not ok
+        print(f"{label:<10} version {dataset.version[:12]}  {seconds * 1000:>8.1f} ms  "
+              f"{'warm' if warm else 'rebuilt':<7}  {'ok' if ok else 'FAIL'}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,57 @@
+"""A local stand-in for GitHub's raw file URLs, with an injected delay, for benchmarks.
+
+    with FakeGitHub(delay=0.2) as gh:
+        image_cache.GITHUB_BASE = gh.base
+        ...
+        gh.requests     # how many requests reached the "network"
+
+Serves files from the repo root in a background thread and answers 404 for
+anything else. Every response waits `delay` seconds first, like a round trip.
+"""
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeGitHub:
+    def __init__(self, delay=0.2, root=ROOT):
+        self.delay = delay
+        self.root = root
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests += 1
+                time.sleep(fake.delay)
+                path = os.path.join(fake.root, os.path.basename(unquote(urlparse(self.path).path)))
+                if not os.path.isfile(path):
+                    self.send_error(404)
+                    return
+                with open(path, "rb") as f:
+                    body = f.read()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self._server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,53 @@
+"""Synthetic review sheets shaped like the Google Sheets export, for benchmarks."""
+import io
+
+import numpy as np
+import pandas as pd
+
+BRANDS = [
+    "Jack Daniel's", "Heaven Hill", "Jim Beam", "Bardstown", "Maker's Mark",
+    "Wild Turkey", "Buffalo Trace", "Four Roses", "MGP", "Old Forester",
+    "Willett", "Peerless", "Laphroaig", "Ardbeg", "Redbreast",
+]
+TYPES = ["Bourbon", "Rye", "Scotch", "Irish", "American Single Malt", "Wheated Bourbon"]
+AGES = ["NAS", "", "4", "6 Years", "8 Year", "10 years", "12", "15 Years", "18", "N/A"]
+REVIEWERS = ["randy", "norm", "zach"]
+GUESTS = ["josh", "nathan", "bogzilla", "chrisj", "david", "justin", "tim"]
+
+
+def _scores(rng, n, missing):
+    vals = np.char.mod("%.1f", rng.uniform(2.0, 9.9, n)).astype(object)
+    vals[rng.random(n) < missing] = ""
+    return vals
+
+
+def make_raw_reviews(n, seed=0):
+    """Return an n-row frame of strings matching the raw review sheet's columns."""
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2018-01-01") + pd.to_timedelta(rng.integers(0, 2900, n), unit="D")
+    prices = rng.integers(20, 250, n).astype(str)
+    price = np.where(rng.random(n) < 0.5, np.char.add("$", prices), prices).astype(object)
+    price[rng.random(n) < 0.05] = ""
+
+    df = pd.DataFrame({
+        "date":  dates.strftime("%m/%d/%Y"),
+        "link":  [f"https://youtu.be/{i:011d}" for i in range(n)],
+        "brand": rng.choice(BRANDS, n),
+        "name":  [f"Batch {i % 997} Single Barrel {i}" for i in range(n)],
+    })
+    for r in REVIEWERS:
+        df[r] = _scores(rng, n, 0.05)
+    for g in GUESTS:
+        df[g] = _scores(rng, n, 0.9)
+    df["age"] = rng.choice(AGES, n)
+    df["proof"] = np.char.mod("%.1f", rng.uniform(80, 140, n))
+    df["price"] = price
+    df["type"] = rng.choice(TYPES, n)
+    return df
+
+
+def make_raw_csv(n, seed=0):
+    """Return the synthetic sheet as CSV bytes, as the export URL would serve it."""
+    buf = io.StringIO()
+    make_raw_reviews(n, seed).to_csv(buf, index=False)
+    return buf.getvalue().encode()
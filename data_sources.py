@@ -0,0 +1,171 @@
+"""Where the app's sheets come from.
+
+Every dataset is read through a DataSource chosen by a short spec string:
+
+    gsheet:<sheet id>             Google Sheets CSV export (first tab)
+    gsheet:<sheet id>#<tab>       a named tab, via the gviz CSV endpoint
+    csv:<path>                    local CSV file
+    parquet:<path>                local Parquet file
+    sqlite:<path>#<table>         table in a local SQLite database
+
+Specs come from SPIRITED_<DATASET>_SOURCE environment variables. Setting
+SPIRITED_OFFLINE=1 points every dataset without an explicit override at the
+fixtures in fixtures/, so the app and benchmarks run without network access.
+Specs may contain a {tab} placeholder for multi-tab datasets such as the
+barrel picks.
+"""
+import contextlib
+import io
+import os
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from singleflight import http_get
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SOURCES = {
+    "reviews":      "gsheet:1HPjovmE5GFSBUlH-EyZW2ZhteaI22lqqttLrt_ql46k",
+    "barrel_picks": "gsheet:1X4rhHEsj9gWSUfV4SYpuoiaVeEgbecLeqG58XhbeuJE#{tab}",
+    "scratch":      "gsheet:1IwIjlnjvY2C5kLGN6gKBIp--y2f7MOipyp3e1LcVu1M",
+}
+
+FIXTURE_SOURCES = {
+    "reviews":      "csv:fixtures/reviews.csv",
+    "barrel_picks": "csv:fixtures/barrel_picks_{tab}.csv",
+    "scratch":      "csv:fixtures/reviews.csv",
+}
+
+
+class RawFetch(NamedTuple):
+    content: Optional[bytes]        # None when the server said "not modified"
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class DataSource:
+    """Base class. CSV-backed sources set `csv = True` and implement fetch_csv()."""
+
+    csv = False
+
+    def __init__(self, spec):
+        self.spec = spec
+
+    def read_frame(self):
+        """Return the raw (uncleaned) rows as a DataFrame."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.spec!r})"
+
+
+class GoogleSheetCsv(DataSource):
+    csv = True
+
+    def __init__(self, spec, sheet_id, tab=None, timeout=30):
+        super().__init__(spec)
+        self.timeout = timeout
+        if tab:
+            self.url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={tab}"
+        else:
+            self.url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
+
+    def fetch_csv(self, etag=None, last_modified=None):
+        import requests
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        if headers:
+            resp = requests.get(self.url, headers=headers, timeout=self.timeout)
+        else:
+            resp = http_get(self.url, timeout=self.timeout)
+        if resp.status_code == 304:
+            return RawFetch(None, etag, last_modified)
+        resp.raise_for_status()
+        return RawFetch(resp.content, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+
+    def read_frame(self):
+        return pd.read_csv(io.BytesIO(self.fetch_csv().content))
+
+
+class LocalCsv(DataSource):
+    csv = True
+
+    def __init__(self, spec, path):
+        super().__init__(spec)
+        self.path = path
+
+    def fetch_csv(self, etag=None, last_modified=None):
+        # The file's mtime stands in for Last-Modified
+        mtime = str(os.path.getmtime(self.path))
+        if last_modified == mtime:
+            return RawFetch(None, etag, last_modified)
+        with open(self.path, "rb") as f:
+            return RawFetch(f.read(), None, mtime)
+
+    def read_frame(self):
+        return pd.read_csv(self.path)
+
+
+class LocalParquet(DataSource):
+    def __init__(self, spec, path):
+        super().__init__(spec)
+        self.path = path
+
+    def read_frame(self):
+        return pd.read_parquet(self.path)
+
+
+class Sqlite(DataSource):
+    def __init__(self, spec, path, table):
+        super().__init__(spec)
+        self.path = path
+        self.table = table
+
+    def read_frame(self):
+        import sqlite3
+
+        with contextlib.closing(sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)) as conn:
+            return pd.read_sql_query(f'SELECT * FROM "{self.table}"', conn)
+
+
+def _local_path(path):
+    return path if os.path.isabs(path) else os.path.join(ROOT, path)
+
+
+def source_from_spec(spec):
+    """Build a DataSource from a spec string (see module docstring)."""
+    kind, _, rest = spec.partition(":")
+    target, _, fragment = rest.partition("#")
+    if not target:
+        raise ValueError(f"Invalid data source spec: {spec!r}")
+    if kind == "gsheet":
+        return GoogleSheetCsv(spec, target, tab=fragment or None)
+    if kind == "csv":
+        return LocalCsv(spec, _local_path(target))
+    if kind == "parquet":
+        return LocalParquet(spec, _local_path(target))
+    if kind == "sqlite":
+        if not fragment:
+            raise ValueError(f"sqlite source needs a table: {spec!r}")
+        return Sqlite(spec, _local_path(target), fragment)
+    raise ValueError(f"Unknown data source kind {kind!r} in {spec!r}")
+
+
+def source_spec(dataset):
+    """The configured spec for `dataset`, before any {tab} substitution."""
+    spec = os.environ.get(f"SPIRITED_{dataset.upper()}_SOURCE")
+    if spec:
+        return spec
+    if os.environ.get("SPIRITED_OFFLINE", "").lower() in ("1", "true", "yes"):
+        return FIXTURE_SOURCES[dataset]
+    return DEFAULT_SOURCES[dataset]
+
+
+def configured_source(dataset, **fmt):
+    """The DataSource configured for `dataset` ("reviews", "barrel_picks", ...)."""
+    return source_from_spec(source_spec(dataset).format(**fmt))
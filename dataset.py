@@ -0,0 +1,84 @@
+"""One read-only copy of each published dataset, shared by every session.
+
+Sessions used to hold their own copy of the reviews frame, and pages copied it
+again before filtering. A Dataset is built once per refresh. view() hands out
+a shallow frame that shares the Dataset's column buffers under pandas
+copy-on-write. A page that adds, converts or overwrites a column on its view
+gets its own copy of just that column, and the shared frame is left untouched.
+
+Anything else built from the frame — display tables, indexes, aggregates —
+can be memoized with memo(). Memos are filed under the Dataset's version, the
+content hash of its frame, not under the Dataset object. A rebuild that comes
+out identical starts with every cache warm. A changed frame gets a new hash,
+so everything built from the old one is left behind with it.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# Copy-on-write is the default from pandas 3; opt in on pandas 2 so views stay isolated
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+# Memos of the most recent versions, so a republished identical frame starts warm
+MEMO_VERSIONS = 2
+_memos = OrderedDict()      # version → (memo dict, lock)
+_memos_lock = threading.Lock()
+
+
+def _memo_for(version):
+    if version is None:
+        return {}, threading.Lock()
+    with _memos_lock:
+        entry = _memos.pop(version, None) or ({}, threading.Lock())
+        _memos[version] = entry
+        while len(_memos) > MEMO_VERSIONS:
+            _memos.popitem(last=False)
+    return entry
+
+
+class Dataset:
+    """An immutable published frame plus its version (see content_version)."""
+
+    __slots__ = ("_frame", "version", "_memo", "_memo_lock")
+
+    def __init__(self, frame, version=None):
+        self._frame = frame
+        self.version = version
+        self._memo, self._memo_lock = _memo_for(version)
+
+    @classmethod
+    def from_frame(cls, frame):
+        """A Dataset versioned by the content hash of `frame`."""
+        return cls(frame, content_version(frame))
+
+    def view(self):
+        """A zero-copy frame for one caller to filter, sort or add columns to."""
+        return self._frame.copy(deep=False)
+
+    def memo(self, key, build):
+        """build(frame) once per version, cached under `key`. Frames come back as views."""
+        try:
+            value = self._memo[key]
+        except KeyError:
+            with self._memo_lock:
+                if key not in self._memo:
+                    self._memo[key] = build(self.view())
+                value = self._memo[key]
+        return value.copy(deep=False) if isinstance(value, pd.DataFrame) else value
+
+    def __len__(self):
+        return len(self._frame)
+
+    def __repr__(self):
+        return f"Dataset({len(self)} rows, version={(self.version or '')[:12]!r})"
+
+
+def content_version(frame):
+    """SHA-256 of the frame's columns, dtypes and values in row order."""
+    h = hashlib.sha256(repr(list(zip(frame.columns, map(str, frame.dtypes)))).encode())
+    h.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    return h.hexdigest()
@@ -0,0 +1,154 @@
+"""Multi-criteria row filters over the published reviews.
+
+Built once per dataset version, in the load step next to the search index:
+
+    ranges     date, proof, price, age: the non-missing rows ordered by value,
+               so a [low, high] range is one searchsorted slice, plus each
+               row's rank in that order to test any row against a range
+    values     type, score label, brand: each row's category code and the
+               rows of every category laid end to end
+    flags      one bitmap per reviewer column marking the rows they scored
+
+select() takes {name: criterion}. Criteria AND together; the values listed
+for one column OR together. It starts from the smallest candidate row set and
+narrows it by each remaining criterion, so the cost follows the size of the
+answer rather than the size of the frame.
+"""
+import numpy as np
+import pandas as pd
+
+RANGE_COLS = ("date", "proof", "price", "age")
+VALUE_COLS = ("type", "score", "brand")
+
+
+class _Range:
+    """Criterion: (low, high), inclusive; either end may be None. Missing values never match."""
+
+    def __init__(self, series):
+        self._is_date = pd.api.types.is_datetime64_any_dtype(series)
+        values = series.to_numpy() if self._is_date else series.to_numpy(dtype="float64", na_value=np.nan)
+        present = np.flatnonzero(series.notna().to_numpy())
+        self._order = present[np.argsort(values[present], kind="stable")]
+        self._sorted = values[self._order]
+        self._rank = np.full(len(series), -1, dtype=np.int64)
+        self._rank[self._order] = np.arange(len(self._order))
+
+    def _key(self, value):
+        return pd.Timestamp(value).to_datetime64() if self._is_date else float(value)
+
+    def _span(self, criterion):
+        low, high = criterion
+        lo = 0 if low is None else np.searchsorted(self._sorted, self._key(low), side="left")
+        hi = len(self._sorted) if high is None else np.searchsorted(self._sorted, self._key(high), side="right")
+        return lo, max(lo, hi)
+
+    def bounds(self):
+        """(min, max) of the non-missing values, or None if there are none."""
+        if not len(self._sorted):
+            return None
+        low, high = self._sorted[0], self._sorted[-1]
+        return (pd.Timestamp(low), pd.Timestamp(high)) if self._is_date else (float(low), float(high))
+
+    def count(self, criterion):
+        lo, hi = self._span(criterion)
+        return hi - lo
+
+    def rows(self, criterion):
+        lo, hi = self._span(criterion)
+        return self._order[lo:hi]
+
+    def keep(self, rows, criterion):
+        lo, hi = self._span(criterion)
+        rank = self._rank[rows]
+        return (rank >= lo) & (rank < hi)
+
+
+class _Values:
+    """Criterion: a list of values, any of which matches."""
+
+    def __init__(self, series):
+        self._codes, uniques = pd.factorize(series, sort=True)
+        self.options = list(uniques)
+        self._code_of = {v: i for i, v in enumerate(self.options)}
+        counts = np.bincount(self._codes[self._codes >= 0], minlength=len(self.options))
+        self._start = np.concatenate([[0], np.cumsum(counts)])
+        # Missing values (code -1) sort first; drop them so each category is one slice
+        self._rows = np.argsort(self._codes, kind="stable")[len(self._codes) - self._start[-1]:]
+
+    def _wanted(self, criterion):
+        return [self._code_of[v] for v in criterion if v in self._code_of]
+
+    def count(self, criterion):
+        return sum(self._start[c + 1] - self._start[c] for c in self._wanted(criterion))
+
+    def rows(self, criterion):
+        return np.concatenate(
+            [self._rows[self._start[c]:self._start[c + 1]] for c in self._wanted(criterion)] or [np.empty(0, np.int64)]
+        )
+
+    def keep(self, rows, criterion):
+        # One slot past the last code stays False and catches missing values (code -1)
+        allowed = np.zeros(len(self.options) + 1, dtype=bool)
+        allowed[self._wanted(criterion)] = True
+        return allowed[self._codes[rows]]
+
+
+class _Flags:
+    """Criterion: a list of columns; a row matches if any of them is filled in."""
+
+    def __init__(self, df, columns):
+        self.options = list(columns)
+        self._bitmaps = {c: df[c].notna().to_numpy() for c in columns}
+        self._rows = {c: np.flatnonzero(b) for c, b in self._bitmaps.items()}
+
+    def _wanted(self, criterion):
+        return [c for c in criterion if c in self._bitmaps]
+
+    def count(self, criterion):
+        return sum(len(self._rows[c]) for c in self._wanted(criterion))
+
+    def rows(self, criterion):
+        wanted = self._wanted(criterion)
+        if len(wanted) == 1:
+            return self._rows[wanted[0]]
+        return np.unique(np.concatenate([self._rows[c] for c in wanted] or [np.empty(0, np.int64)]))
+
+    def keep(self, rows, criterion):
+        keep = np.zeros(len(rows), dtype=bool)
+        for c in self._wanted(criterion):
+            keep |= self._bitmaps[c][rows]
+        return keep
+
+
+class FilterIndex:
+    def __init__(self, df, reviewers=()):
+        """reviewers – score columns offered by the "reviewer" criterion."""
+        self.n_rows = len(df)
+        self._filters = {c: _Range(df[c]) for c in RANGE_COLS if c in df.columns}
+        self._filters.update({c: _Values(df[c]) for c in VALUE_COLS if c in df.columns})
+        self._filters["reviewer"] = _Flags(df, [c for c in reviewers if c in df.columns])
+
+    def bounds(self, name):
+        """(min, max) of a range column, for sizing a slider."""
+        return self._filters[name].bounds()
+
+    def options(self, name):
+        """The values a value or reviewer criterion can pick from, sorted."""
+        return self._filters[name].options
+
+    def select(self, criteria):
+        """Sorted row positions matching every criterion, or None if no criterion is set.
+
+        criteria – {name: criterion}; entries set to None are ignored.
+        """
+        active = [(self._filters[name], c) for name, c in criteria.items() if c is not None]
+        if not active:
+            return None
+        active.sort(key=lambda fc: fc[0].count(fc[1]))
+        (first, criterion), rest = active[0], active[1:]
+        rows = first.rows(criterion)
+        for f, c in rest:
+            if not len(rows):
+                break
+            rows = rows[f.keep(rows, c)]
+        return np.sort(rows)
@@ -0,0 +1,170 @@
+"""Pre-resized WebP variants of the repo's images, plus a manifest.
+
+Build step, re-run after adding or replacing an image:
+
+    python image_assets.py
+
+For every image in VARIANT_IMAGES, writes WebP copies at VARIANT_WIDTHS to
+static/img/. An image narrower than a target width gets a copy at its own
+width instead. Each build is recorded in static/img/manifest.json with
+the source's SHA-256, so unchanged images are skipped next time.
+
+Pages call variant_url() with the CSS width they show an image at. They get
+back the URL of the smallest variant that still covers it on a high-density
+screen, or None if the image has no variants (e.g. a pick label only hosted
+on GitHub). The URL is served by Streamlit's static serving (see
+.streamlit/config.toml), and the page draws it as a lazy-loading <img>
+(image_html), so the Python process never touches the bytes. Variant names
+carry the source's content hash, so browsers may cache them forever. With
+static serving off, variant_url() returns None and pages fall back to
+image_cache.
+"""
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, "static")
+VARIANT_DIR = os.path.join(STATIC_DIR, "img")
+MANIFEST_PATH = os.path.join(VARIANT_DIR, "manifest.json")
+STATIC_URL = "app/static"        # relative, so it also works under a baseUrlPath
+VARIANT_URL = f"{STATIC_URL}/img"
+
+VARIANT_WIDTHS = (160, 320, 640, 1280)
+WEBP_QUALITY = 80
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Images in the repo root that pages show; add a new pick label here before rebuilding
+VARIANT_IMAGES = (
+    # Logo, scoring key and crew photos
+    "srlogo.png", "Scoring_Sheet_Final.jpg", "Randy.png", "Norm.png", "Zach.png", "Justin.png",
+    # Barrel pick labels
+    "boggs.png", "da.png", "irishkelvin.jpg", "king_kelvin.png", "kogac.png", "larry.png",
+    "peerless_rye.png", "shortb.jpg", "snw.png", "stogie.jpeg",
+)
+
+# Device pixels per CSS pixel to cover; 2 keeps images sharp on most phones and laptops
+PIXEL_RATIO = 2
+
+_manifest = None        # (mtime, manifest) of the last manifest read
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _variant_name(filename, digest, width):
+    return f"{re.sub(r'[^A-Za-z0-9._-]', '_', filename)}-{digest[:16]}-{width}.webp"
+
+
+def _build_one(path, digest, out_dir, widths):
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB")
+        width, height = img.size
+        targets = sorted({min(w, width) for w in widths})
+
+        variants = []
+        for w in targets:
+            resized = img if w == width else img.resize((w, round(height * w / width)), Image.LANCZOS)
+            name = _variant_name(os.path.basename(path), digest, w)
+            resized.save(os.path.join(out_dir, name), "WEBP", quality=WEBP_QUALITY)
+            variants.append({"width": w, "file": name, "bytes": os.path.getsize(os.path.join(out_dir, name))})
+    return {"width": width, "height": height, "variants": variants}
+
+
+def build(src_dir=ROOT, out_dir=VARIANT_DIR, widths=VARIANT_WIDTHS, filenames=VARIANT_IMAGES):
+    """(Re)build variants for each of `filenames` in `src_dir` whose content changed. Returns the manifest."""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    try:
+        with open(manifest_path) as f:
+            old = json.load(f)["images"]
+    except (OSError, ValueError, KeyError):
+        old = {}
+
+    images = {}
+    for filename in sorted(filenames):
+        path = os.path.join(src_dir, filename)
+        if not os.path.isfile(path):
+            print(f"No image {filename} in {src_dir}; skipping it", file=sys.stderr)
+            continue
+        digest = _sha256_file(path)
+        entry = old.get(filename)
+        if (entry is None or entry["sha256"] != digest or entry.get("widths") != list(widths)
+                or not all(v["file"] == _variant_name(filename, digest, v["width"])
+                           and os.path.exists(os.path.join(out_dir, v["file"])) for v in entry["variants"])):
+            entry = {"sha256": digest, "bytes": os.path.getsize(path), "widths": list(widths),
+                     **_build_one(path, digest, out_dir, widths)}
+        images[filename] = entry
+
+    # Drop variants of images that were removed, unlisted or rebuilt at other widths
+    keep = {v["file"] for e in images.values() for v in e["variants"]} | {"manifest.json"}
+    for name in os.listdir(out_dir):
+        if name.endswith(".webp") and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+
+    with open(manifest_path, "w") as f:
+        json.dump({"images": images}, f, indent=2, sort_keys=True)
+    return {"images": images}
+
+
+def manifest():
+    """The built manifest, re-read whenever the file changes; empty if there isn't one."""
+    global _manifest
+    try:
+        mtime = os.path.getmtime(MANIFEST_PATH)
+    except OSError:
+        return {"images": {}}
+    if _manifest is None or _manifest[0] != mtime:
+        with open(MANIFEST_PATH) as f:
+            _manifest = (mtime, json.load(f))
+    return _manifest[1]
+
+
+def pick_variant(entry, width):
+    """The smallest variant of a manifest entry at least `width` × PIXEL_RATIO wide, else the largest."""
+    need = width * PIXEL_RATIO
+    variants = sorted(entry["variants"], key=lambda v: v["width"])
+    return next((v for v in variants if v["width"] >= need), variants[-1])
+
+
+def static_serving():
+    """Whether Streamlit serves static/ at /app/static/ (server.enableStaticServing)."""
+    import streamlit as st
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+def variant_url(filename, width):
+    """URL of the variant of `filename` to show at `width` CSS pixels, or None if it has none."""
+    entry = manifest()["images"].get(os.path.basename(str(filename)))
+    if entry is None or not static_serving():
+        return None
+    return f"{VARIANT_URL}/{pick_variant(entry, width)['file']}"
+
+
+def image_html(src, alt="", width=None):
+    """A lazy-loading <img> for `src`, `width` CSS pixels wide or the full column."""
+    size = f"width:{width}px;max-width:100%" if width else "width:100%"
+    return (f'<img src="{html.escape(src)}" alt="{html.escape(alt)}" loading="lazy" decoding="async" '
+            f'style="{size};height:auto;display:block;">')
+
+
+if __name__ == "__main__":
+    built = build()["images"]
+    total_src = sum(e["bytes"] for e in built.values())
+    total_out = sum(v["bytes"] for e in built.values() for v in e["variants"])
+    for filename, e in built.items():
+        sizes = ", ".join(f"{v['width']}px {v['bytes'] / 1024:.0f} KB" for v in e["variants"])
+        print(f"{filename:<42} {e['bytes'] / 1024:>7.0f} KB → {sizes}")
+    print(f"{len(built)} images, {total_src / 1e6:.1f} MB of originals → {total_out / 1e6:.1f} MB of variants",
+          file=sys.stderr)
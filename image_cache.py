@@ -0,0 +1,274 @@
+"""Shared cache of the images the pages fetch from GitHub.
+
+load_image() used to live in each page and ran a GitHub request plus a PIL
+decode for every person and pick on every rerun. Now there is one loader:
+
+    memory LRU  →  on-disk store  →  GitHub  →  local file
+
+The memory LRU holds encoded bytes keyed by content hash and is capped at
+MEMORY_LIMIT_BYTES. The disk store keeps one file per (filename, content
+hash) in static/cache/, plus an index of which hash each filename
+currently has. Being under static/, the stored copies double as static
+files: with static serving on, image_source() hands pages their URL, and
+the browser fetches the image without the Python process decoding or
+re-encoding it. Entries younger than MAX_AGE_SECONDS are served
+without touching the network. After that the image is fetched again, and
+if GitHub can't be reached the stale copy is still served.
+
+A requested name can resolve to its .jpg/.jpeg sibling, or to nothing at
+all (a pick with no label yet). Each lookup walks the candidates one
+request at a time. The outcome is remembered: a found name for
+RESOLVED_TTL_SECONDS and a miss for MISSING_TTL_SECONDS. Missing images
+then cost nothing until the memo expires. forget_resolutions() clears it,
+so a refresh picks up newly uploaded images straight away.
+
+image_sources() resolves the images a page needs concurrently, at most
+FETCH_WORKERS at a time. Pages call it before drawing their layout, so a
+cold view waits about as long as the slowest single fetch rather than the
+sum of all of them.
+
+Names come from the barrel picks sheet, so they're treated as untrusted:
+only the basename is used, it must have an image extension, the local
+fallback only reads from the repo root, and bytes that don't decode as a
+PNG or JPEG are never stored (static/cache/ is public).
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+from image_assets import IMAGE_EXTENSIONS, ROOT, STATIC_DIR, STATIC_URL, static_serving
+from singleflight import http_get
+
+log = logging.getLogger(__name__)
+
+GITHUB_BASE = "https://github.com/tpfeeney/spirited-reviews/blob/main"
+IMAGE_CACHE_DIR = os.path.join(STATIC_DIR, "cache")
+CACHE_URL = f"{STATIC_URL}/cache"
+INDEX_PATH = os.path.join(IMAGE_CACHE_DIR, "index.json")
+
+MEMORY_LIMIT_BYTES = 32 << 20
+MAX_AGE_SECONDS = 24 * 3600
+RESOLVED_TTL_SECONDS = 3600
+MISSING_TTL_SECONDS = 600
+FETCH_WORKERS = 8
+
+_memory = OrderedDict()     # sha256 → bytes, least recently used first
+_memory_bytes = 0
+_index = None               # filename → {"sha256", "file", "bytes", "fetched_at"}
+_resolved = {}              # requested filename → (candidate that exists or None, expires_at)
+_lock = threading.Lock()
+
+
+def _image_name(filename):
+    """The basename of a requested image, or None if it's blank or not an image file."""
+    name = os.path.basename(str(filename or "").strip())
+    if name in ("", "nan") or not name.lower().endswith(IMAGE_EXTENSIONS):
+        return None
+    return name
+
+
+def image_names(filename):
+    """The filename as-is, then its .jpg/.jpeg sibling."""
+    candidates = [filename]
+    if filename.lower().endswith(".jpg"):
+        candidates.append(filename[:-4] + ".jpeg")
+    elif filename.lower().endswith(".jpeg"):
+        candidates.append(filename[:-5] + ".jpg")
+    return candidates
+
+
+# ── Memory LRU ───────────────────────────────────────────────────────────────
+def _remember(sha, data):
+    global _memory_bytes
+    if len(data) > MEMORY_LIMIT_BYTES:
+        return
+    if sha in _memory:
+        _memory.move_to_end(sha)
+        return
+    _memory[sha] = data
+    _memory_bytes += len(data)
+    while _memory_bytes > MEMORY_LIMIT_BYTES:
+        _, evicted = _memory.popitem(last=False)
+        _memory_bytes -= len(evicted)
+
+
+def _recall(sha):
+    data = _memory.get(sha)
+    if data is not None:
+        _memory.move_to_end(sha)
+    return data
+
+
+# ── Disk store ───────────────────────────────────────────────────────────────
+def _load_index():
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_PATH) as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def _write_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=IMAGE_CACHE_DIR, prefix=".img.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _read_stored(entry):
+    """Bytes of an index entry, from memory or disk; None if the file is gone."""
+    data = _recall(entry["sha256"])
+    if data is None:
+        try:
+            with open(os.path.join(IMAGE_CACHE_DIR, entry["file"]), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        _remember(entry["sha256"], data)
+    return data
+
+
+def _store(filename, data):
+    sha = hashlib.sha256(data).hexdigest()
+    stem, ext = os.path.splitext(re.sub(r"[^A-Za-z0-9._-]", "_", filename))
+    entry = {"sha256": sha, "file": f"{stem}-{sha[:16]}{ext}", "bytes": len(data), "fetched_at": time.time()}
+    _remember(sha, data)
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        path = os.path.join(IMAGE_CACHE_DIR, entry["file"])
+        if not os.path.exists(path):
+            _write_atomic(path, data)
+        index = _load_index()
+        old = index.get(filename)
+        index[filename] = entry
+        if old and old["file"] != entry["file"] and all(e["file"] != old["file"] for e in index.values()):
+            os.remove(os.path.join(IMAGE_CACHE_DIR, old["file"]))
+        _write_atomic(INDEX_PATH, json.dumps(index).encode())
+    except OSError as e:
+        log.warning("Could not store image %s in %s: %s", filename, IMAGE_CACHE_DIR, e)
+
+
+# ── Loading ──────────────────────────────────────────────────────────────────
+def _is_image(data):
+    """Whether `data` decodes as a PNG or JPEG."""
+    from PIL import Image
+
+    try:
+        with Image.open(BytesIO(data)) as img:
+            img.verify()
+            return img.format in ("PNG", "JPEG")
+    except Exception:
+        return False
+
+
+def _fetch(filename):
+    """Bytes of image `filename` from GitHub, else from the repo root; None if neither has a valid one."""
+    try:
+        resp = http_get(f"{GITHUB_BASE}/{filename}?raw=true", timeout=5)
+        if resp.status_code == 200 and _is_image(resp.content):
+            return resp.content
+    except Exception:
+        pass
+    try:
+        with open(os.path.join(ROOT, filename), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    return data if _is_image(data) else None
+
+
+def _load_one(filename):
+    with _lock:
+        entry = _load_index().get(filename)
+        if entry is not None and time.time() - entry["fetched_at"] < MAX_AGE_SECONDS:
+            data = _read_stored(entry)
+            if data is not None:
+                return data
+
+    data = _fetch(filename)
+
+    with _lock:
+        if data is None:
+            # A stale copy beats a placeholder when GitHub is down
+            return _read_stored(entry) if entry is not None else None
+        _store(filename, data)
+    return data
+
+
+def load_image(filename):
+    """Encoded bytes of `filename` (or its .jpg/.jpeg sibling), or None if it can't be found."""
+    filename = _image_name(filename)
+    if filename is None:
+        return None
+
+    with _lock:
+        name, expires_at = _resolved.get(filename, (None, 0))
+    if time.time() < expires_at:
+        if name is None:
+            return None
+        data = _load_one(name)
+        if data is not None:
+            return data
+
+    # Unresolved, expired, or the remembered candidate has gone: try them all
+    for name in image_names(filename):
+        data = _load_one(name)
+        if data is not None:
+            with _lock:
+                _resolved[filename] = (name, time.time() + RESOLVED_TTL_SECONDS)
+            return data
+    with _lock:
+        _resolved[filename] = (None, time.time() + MISSING_TTL_SECONDS)
+    return None
+
+
+def image_source(filename):
+    """What a page should draw for `filename`: the URL of its stored copy when static serving
+    is on, else its bytes. None if it can't be found."""
+    data = load_image(filename)
+    if data is None or not static_serving():
+        return data
+    with _lock:
+        name = _resolved.get(_image_name(filename), (None, 0))[0]
+        entry = _load_index().get(name)
+    # Not stored (e.g. the cache dir is read-only): the bytes still work through st.image
+    return f"{CACHE_URL}/{entry['file']}" if entry else data
+
+
+def _concurrently(fn, filenames, max_workers):
+    names = list(dict.fromkeys(f for f in filenames if f))
+    if len(names) <= 1:
+        return {name: fn(name) for name in names}
+    with ThreadPoolExecutor(min(max_workers, len(names)), thread_name_prefix="image-fetch") as pool:
+        return dict(zip(names, pool.map(fn, names)))
+
+
+def load_images(filenames, max_workers=FETCH_WORKERS):
+    """load_image() for each of `filenames`, concurrently. Returns {filename: bytes or None}."""
+    return _concurrently(load_image, filenames, max_workers)
+
+
+def image_sources(filenames, max_workers=FETCH_WORKERS):
+    """image_source() for each of `filenames`, concurrently. Returns {filename: URL, bytes or None}."""
+    return _concurrently(image_source, filenames, max_workers)
+
+
+def forget_resolutions():
+    """Drop the resolution memo, so every name is looked up again on next use."""
+    with _lock:
+        _resolved.clear()
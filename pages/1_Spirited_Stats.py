@@ -1,8 +1,5 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from utils import add_sidebar_logo, get_data, REVIEWER_COLS
+from utils import add_sidebar_logo, filter_index, get_dataset, REVIEWER_COLS
 
 st.set_page_config(
     page_title="Spirited Stats",
@@ -105,7 +102,8 @@ add_sidebar_logo()
 
 st.title("Spirited Stats")
 
-df = get_data()
+dataset = get_dataset()
+df = dataset.view()
 
 if df is None or df.empty:
     st.error("No data available. Please return to the main page.")
@@ -115,13 +113,13 @@ active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
 
 # ── Sidebar filters ───────────────────────────────────────────────────────────
 if 'type' in df.columns and not df['type'].dropna().empty:
-    unique_types = sorted(df['type'].dropna().unique())
-    type_option = st.sidebar.radio("Restrict to Type:", options=["All Types"] + unique_types, index=0)
+    type_option = st.sidebar.radio("Restrict to Type:", options=["All Types"] + filter_index(dataset).options("type"),
+                                   index=0)
 else:
     type_option = "All Types"
 
 if type_option != "All Types":
-    df = df[df['type'] == type_option]
+    df = df.take(filter_index(dataset).select({"type": [type_option]}))
 
 if df.empty:
     st.warning("No data available for the selected filters.")
@@ -132,10 +130,6 @@ selected_name = st.sidebar.radio("Select Person", name_options)
 selected_key = selected_name.lower()
 
 # ── Metrics ───────────────────────────────────────────────────────────────────
-for col in active_reviewers:
-    df[col] = pd.to_numeric(df[col], errors='coerce')
-df['avg'] = pd.to_numeric(df['avg'], errors='coerce')
-
 scores = df['avg'] if selected_key == "overall" else df[selected_key]
 
 col1, col2, col3, col4 = st.columns(4)
@@ -151,6 +145,10 @@ col3.metric("Median",          f"{scores.median():.2f}")
 col4.metric("75th Percentile", f"{scores.quantile(0.75):.2f}")
 
 # ── Boxplot ───────────────────────────────────────────────────────────────────
+# Not imported when the filters leave no reviews
+import matplotlib.pyplot as plt
+import seaborn as sns
+
 df_melted = df.melt(
     value_vars=active_reviewers,
     var_name='Person', value_name='Score'
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 from utils import add_sidebar_logo, get_data, REVIEWER_COLS
 
@@ -112,20 +111,6 @@ if df is None or df.empty:
 
 active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
 
-# ── Data prep ─────────────────────────────────────────────────────────────────
-page_df = df.copy()
-page_df['age_new'] = pd.to_numeric(page_df['age'], errors='coerce')
-page_df['avg']     = pd.to_numeric(page_df['avg'],   errors='coerce')
-page_df['proof']   = pd.to_numeric(page_df['proof'], errors='coerce')
-page_df['price']   = pd.to_numeric(page_df['price'], errors='coerce')
-for c in active_reviewers:
-    page_df[c] = pd.to_numeric(page_df[c], errors='coerce')
-
-bins   = [79, 89, 94, 99, 104, 109, 114, 119, 129, 139, 149, float('inf')]
-labels = ["80-89","90-94","95-99","100-104","105-109",
-          "110-114","115-119","120-129","130-139","140-149",">=150"]
-page_df['proof_cat'] = pd.cut(page_df['proof'], bins=bins, labels=labels, right=True)
-
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 chart_type = st.sidebar.radio(
     "Select chart type:",
@@ -135,7 +120,7 @@ chart_type = st.sidebar.radio(
 
 # ── Charts ────────────────────────────────────────────────────────────────────
 if chart_type == "Proof Breakdown":
-    proof_df = page_df['proof_cat'].value_counts().sort_index().reset_index()
+    proof_df = df['proof_cat'].value_counts().sort_index().reset_index()
     proof_df.columns = ['Proof Category', 'Count']
     fig = px.bar(proof_df, x='Proof Category', y='Count',
                  title="Number of Observations per Proof Category",
@@ -155,7 +140,7 @@ if chart_type == "Proof Breakdown":
     st.plotly_chart(fig, use_container_width=True)
 
 elif chart_type == "Type Breakdown":
-    type_counts = page_df['type'].value_counts().reset_index()
+    type_counts = df['type'].value_counts().reset_index()
     type_counts.columns = ['type', 'count']
     fig = px.pie(type_counts, names='type', values='count',
                  title="Distribution of Whiskey Types")
@@ -172,7 +157,7 @@ elif chart_type == "Type Breakdown":
     st.plotly_chart(fig, use_container_width=True)
 
 elif chart_type == "Price v Review":
-    fig = px.scatter(page_df, x="price", y="avg", trendline="ols",
+    fig = px.scatter(df, x="price", y="avg", trendline="ols",
                      labels={"avg": "Average Rating", "price": "Price ($)"},
                      hover_name="name")
     fig.update_layout(
@@ -187,7 +172,7 @@ elif chart_type == "Price v Review":
     st.plotly_chart(fig, use_container_width=True)
 
 elif chart_type == "Proof v Review":
-    fig = px.scatter(page_df, x="proof", y="avg", trendline="ols",
+    fig = px.scatter(df, x="proof", y="avg", trendline="ols",
                      labels={"avg": "Average Rating", "proof": "Proof"},
                      hover_name="name")
     fig.update_layout(
@@ -202,9 +187,9 @@ elif chart_type == "Proof v Review":
     st.plotly_chart(fig, use_container_width=True)
 
 elif chart_type == "Age v Review":
-    age_df = page_df[page_df['age_new'].notna()]
-    fig = px.scatter(age_df, x="age_new", y="avg", trendline="ols",
-                     labels={"avg": "Average Rating", "age_new": "Age"},
+    age_df = df[df['age'].notna()]
+    fig = px.scatter(age_df, x="age", y="avg", trendline="ols",
+                     labels={"avg": "Average Rating", "age": "Age"},
                      hover_name="name")
     fig.update_layout(
         paper_bgcolor='#1a0a00',
@@ -222,7 +207,7 @@ elif chart_type == "Choose your own adventure":
 
     all_options = {
         "avg":     "Overall Average",
-        "age_new": "Age",
+        "age":     "Age",
         "price":   "Price ($)",
         "proof":   "Proof",
         **{c: f"{c.capitalize()} Score" for c in active_reviewers},
@@ -246,7 +231,7 @@ elif chart_type == "Choose your own adventure":
     trendline_map = {"None": None, "OLS": "ols", "LOWESS": "lowess"}
 
     fig = px.scatter(
-        page_df, x=x_col_key, y=y_col_key,
+        df, x=x_col_key, y=y_col_key,
         trendline=trendline_map[trendline_option],
         labels={x_col_key: all_options[x_col_key], y_col_key: all_options[y_col_key]},
         title=f"{all_options[y_col_key]} vs {all_options[x_col_key]}",
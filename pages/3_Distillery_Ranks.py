@@ -1,8 +1,6 @@
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
-from utils import add_sidebar_logo, get_data, REVIEWER_COLS
+from utils import add_sidebar_logo, filter_index, get_dataset, striped_table, REVIEWER_COLS
+from tables import brand_averages, brand_rows
 
 st.set_page_config(
     page_title="Distillery Ranks",
@@ -103,7 +101,8 @@ st.markdown("""
 
 add_sidebar_logo()
 
-df = get_data()
+dataset = get_dataset()
+df = dataset.view()
 
 if df is None or df.empty:
     st.error("No data available. Please return to the main page.")
@@ -113,20 +112,13 @@ if 'type' not in df.columns:
     st.error("'type' column not found in the dataframe.")
     st.stop()
 
-# ── Legacy distillery list ────────────────────────────────────────────────────
-legacy_brands = [
-    "Jack Daniel's", "Heaven Hill", "Jim Beam", "Bardstown", "Maker's Mark",
-    "Wild Turkey", "Buffalo Trace", "Four Roses", "MGP",
-    "Old Forester", "Willett"
-]
-
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 st.sidebar.header("Filters")
 
 distillery_option = st.sidebar.radio("Select Distillery Type:", ("All", "Legacy Distillery"))
 
-unique_types = sorted(df['type'].dropna().unique())
-type_option = st.sidebar.radio("Restrict to Type:", options=["All Types"] + list(unique_types), index=0)
+filters = filter_index(dataset)
+type_option = st.sidebar.radio("Restrict to Type:", options=["All Types"] + filters.options("type"), index=0)
 
 reviewers = [c for c in REVIEWER_COLS if c in df.columns]
 selected_reviewers = []
@@ -139,11 +131,9 @@ for r in reviewers:
         selected_reviewers.append(r)
 
 # ── Filter ────────────────────────────────────────────────────────────────────
-df_filtered = df.copy()
-if distillery_option == "Legacy Distillery":
-    df_filtered = df_filtered[df_filtered['brand'].isin(legacy_brands)]
-if type_option != "All Types":
-    df_filtered = df_filtered[df_filtered['type'] == type_option]
+legacy_only = distillery_option == "Legacy Distillery"
+rows = brand_rows(dataset, legacy_only, type_option)
+df_filtered = df if rows is None else df.take(rows)
 
 if df_filtered.empty:
     st.warning("No data available for the selected filters.")
@@ -155,40 +145,19 @@ theme = st.sidebar.radio("Table theme", ["Dark", "Light"], horizontal=True)
 # ── Average scores table ──────────────────────────────────────────────────────
 st.header("Average Scores by Brand")
 
-grouped = df_filtered.groupby('brand')[selected_reviewers].mean().reset_index()
-review_counts = df_filtered.groupby('brand').size().reset_index(name='# of Reviews')
-grouped = pd.merge(grouped, review_counts, on='brand', how='left')
-
-rename_dict = {r: ("Overall Avg" if r == 'avg' else f"{r.capitalize()} Avg") for r in selected_reviewers}
-grouped.rename(columns=rename_dict, inplace=True)
-
-sort_col = "Overall Avg" if "Overall Avg" in grouped.columns else grouped.columns[1]
-grouped = grouped.round(2).sort_values(by=sort_col, ascending=False).reset_index(drop=True)
-
-if theme == "Dark":
-    odd_color  = "#1a1a1a"
-    even_color = "#2a2a2a"
-    text_color = "#eeeeee"
-else:
-    odd_color  = "#ffffff"
-    even_color = "#f2efe8"
-    text_color = "#222222"
-
-def color_rows(row):
-    color = odd_color if row.name % 2 == 0 else even_color
-    return [f"background-color: {color}; color: {text_color}"] * len(row)
+grouped = brand_averages(dataset, selected_reviewers, legacy_only, type_option)
 
 avg_cols = [col for col in grouped.columns if 'Avg' in col]
-styled = (
-    grouped.style
-    .apply(color_rows, axis=1)
-    .format({col: "{:.2f}" for col in avg_cols})
-)
+styled = striped_table(grouped, theme, formats={col: "{:.2f}" for col in avg_cols})
 
 st.dataframe(styled, use_container_width=True, hide_index=True)
 
 # ── Boxplot — dynamic height based on brand count ─────────────────────────────
 if selected_reviewers:
+    # Plotting libraries are slow to import; load them only when the plot is drawn
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     st.header("Score Distribution by Brand")
 
     df_melted = df_filtered[['brand'] + selected_reviewers].melt(
@@ -197,6 +166,8 @@ if selected_reviewers:
     df_melted['Reviewer'] = df_melted['Reviewer'].apply(
         lambda x: "Overall" if x == 'avg' else x.capitalize()
     )
+    # brand is categorical — drop brands filtered out above so they don't get empty boxes
+    df_melted['brand'] = df_melted['brand'].cat.remove_unused_categories()
 
     n_brands = df_filtered['brand'].nunique()
     # Scale height with brand count so labels don't get squished
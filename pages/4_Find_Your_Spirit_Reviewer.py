@@ -1,10 +1,7 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from scipy import stats
-from utils import add_sidebar_logo, get_data, score_label, REVIEWER_COLS
+from utils import add_sidebar_logo, get_dataset, score_label, table_positions, table_window, REVIEWER_COLS
 
 st.set_page_config(
     page_title="Find Your Reviewer",
@@ -111,7 +108,8 @@ st.info(
 
 add_sidebar_logo()
 
-df = get_data()
+dataset = get_dataset()
+df = dataset.view()
 
 if df is None or df.empty:
     st.error("No data available. Please return to the main page.")
@@ -120,30 +118,16 @@ if df is None or df.empty:
 active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
 
 # ── Editable table with select checkboxes ─────────────────────────────────────
-display_df = df.copy()
-if "select" not in display_df.columns:
-    display_df["select"] = False
-
-# ── Style the table to match main page ────────────────────────────────────────
-styled_df = display_df.copy()
-
-# Format columns for display
-for c in active_reviewers + ['avg']:
-    if c in styled_df.columns:
-        styled_df[c] = pd.to_numeric(styled_df[c], errors='coerce')
-
-if 'proof' in styled_df.columns:
-    styled_df['proof'] = pd.to_numeric(styled_df['proof'], errors='coerce')
-if 'price' in styled_df.columns:
-    styled_df['price'] = pd.to_numeric(styled_df['price'], errors='coerce')
+# Only one page of the catalog goes to the browser. Picks are remembered by row
+# in session state so they survive paging; they belong to this dataset version.
+editor_cols = ["date", "link", "brand", "name", "avg", "score",
+               *active_reviewers, "age", "proof", "price", "type"]
+picked = st.session_state.setdefault(f"picked_reviews_{dataset.version}", set())
 
-odd_color  = "#1a1a1a"
-even_color = "#2a2a2a"
-text_color = "#eeeeee"
-
-def color_rows(row):
-    color = odd_color if row.name % 2 == 0 else even_color
-    return [f"background-color: {color}; color: {text_color}"] * len(row)
+positions = table_positions(dataset, "date")
+start, stop = table_window("pick", len(positions))
+display_df = df.iloc[positions[start:stop]][editor_cols]
+display_df["select"] = display_df.index.isin(picked)
 
 reviewer_col_config = {
     c: st.column_config.NumberColumn(c.capitalize(), format="%.1f") for c in active_reviewers
@@ -174,7 +158,11 @@ edited_df = st.data_editor(
     use_container_width=True,
 )
 
-selected_rows = edited_df[edited_df["select"]]
+picked.update(edited_df.index[edited_df["select"]])
+picked.difference_update(edited_df.index[~edited_df["select"]])
+st.caption(f"{len(picked)} selected")
+
+selected_rows = df.loc[sorted(picked)]
 
 if len(selected_rows) == 0:
     st.info("☝️ Check boxes above to select whiskeys you've tried.")
@@ -237,6 +225,10 @@ st.dataframe(
 )
 
 # ── Box plot comparison ───────────────────────────────────────────────────────
+# Not imported until whiskeys are checked above
+import plotly.express as px
+import plotly.graph_objects as go
+
 box_df = selected_rows.reset_index()[["name"] + active_reviewers].melt(
     id_vars=["name"], var_name="Reviewer", value_name="Score"
 )
@@ -293,6 +285,7 @@ if user_scores:
 
         # Pearson requires at least 3 paired observations and non-zero variance
         if len(user_common) >= 3 and user_common.std() > 0 and reviewer_aligned.std() > 0:
+            from scipy import stats
             r_val, p_val = stats.pearsonr(user_common.values, reviewer_aligned.values)
             correlations[r.capitalize()] = {"r": round(r_val, 3), "p": round(p_val, 4), "n": len(user_common)}
         elif len(user_common) >= 1:
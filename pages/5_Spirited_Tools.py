@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 import math
 from io import StringIO
-from sklearn.linear_model import LinearRegression
 from utils import add_sidebar_logo
 
 # ── Page config ────────────────────────────────────────────────────────────────
@@ -626,6 +625,8 @@ elif tool == "🌾 Mash Bill Calculator":
 # TOOL 3 — Alcohol Density Predictor
 # ══════════════════════════════════════════════════════════════════════════════
 elif tool == "🔬 Split Volume Calculator":
+    # sklearn takes about a second to import; only this tool needs it
+    from sklearn.linear_model import LinearRegression
 
     st.markdown("""
     <div class="header-banner">
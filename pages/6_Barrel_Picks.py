@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
-from utils import add_sidebar_logo
+from barrel_picks import load_barrel_picks
+from image_assets import variant_url
+from image_cache import forget_resolutions, image_names, image_source, image_sources
+from utils import add_sidebar_logo, bump_source, refresh_button, show_image, source_version
 
 st.set_page_config(
     page_title="Barrel Picks",
@@ -97,92 +100,22 @@ add_sidebar_logo()
 st.title("🛢️ Barrel Picks")
 st.caption("Our hand-selected single barrel picks — past and future.")
 
-# ── Sheet config ───────────────────────────────────────────────────────────────
-SPREADSHEET_ID = "1X4rhHEsj9gWSUfV4SYpuoiaVeEgbecLeqG58XhbeuJE"
-
-# Maps sheet column headers → internal field names used by render_pick()
-COLUMN_MAP = {
-    "Distillery/Company": "distillery",
-    "Brand":              "brand",
-    "Distillate":         "distillate_info",
-    "Mashbill":           "mashbill",
-    "Proof":              "proof",
-    "Age":                "age",
-    "Pick Name":          "name",
-    "Pick Date":          "pick_date",
-    "Release Date":       "release_date",
-    "Pick Team":          "pick_team",
-    "Location":           "location",
-    "Nose":               "nose",
-    "Palate":             "palate",
-    "Mouthfeel":          "mouthfeel",
-    "Finish":             "finish",
-    "Video":              "video",
-    "Status":             "status",
-    "Details":            "description",
-    "Image File":         "image_file",
-    "Image file":         "image_file",
-}
-
-
-# ── Data loader ────────────────────────────────────────────────────────────────
-@st.cache_data(ttl=300)
-def load_barrel_picks():
-    try:
-        base = f"https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}/gviz/tq?tqx=out:csv&sheet="
-        dfs = []
-        for sheet_name, tab in [("InProg", "upcoming"), ("Released", "previous")]:
-            try:
-                df = pd.read_csv(base + sheet_name)
-                df.columns = df.columns.str.strip()
-                df.rename(columns={k: v for k, v in COLUMN_MAP.items() if k in df.columns}, inplace=True)
-                df["_tab"] = tab
-                dfs.append(df)
-            except Exception:
-                pass
-        if not dfs:
-            st.error("Could not load any barrel picks tabs.")
-            return pd.DataFrame()
-        combined = pd.concat(dfs, ignore_index=True)
-        combined["status"] = combined["status"].astype(str).str.strip().str.lower()
-        if "name" in combined.columns:
-            combined = combined[combined["name"].astype(str).str.strip().replace("nan", "") != ""]
-        return combined
-    except Exception as e:
-        st.error(f"Could not load barrel picks data: {e}")
-        return pd.DataFrame()
-
-
-# ── Image loader ───────────────────────────────────────────────────────────────
-GITHUB_BASE = "https://github.com/tpfeeney/spirited-reviews/blob/main"
-
-
-def load_image(filename):
-    if not filename or str(filename).strip() in ("", "nan"):
-        return None
-    import requests
-    from PIL import Image
-    from io import BytesIO
-
-    # Try the filename as-is, then common extension variants
-    candidates = [filename]
-    if filename.lower().endswith(".jpg"):
-        candidates.append(filename[:-4] + ".jpeg")
-    elif filename.lower().endswith(".jpeg"):
-        candidates.append(filename[:-5] + ".jpg")
-
-    for name in candidates:
-        url = f"{GITHUB_BASE}/{name}?raw=true"
-        try:
-            resp = requests.get(url, timeout=5)
-            if resp.status_code == 200:
-                return Image.open(BytesIO(resp.content))
-        except Exception:
-            pass
-    try:
-        return Image.open(filename)
-    except Exception:
+# ── Images ─────────────────────────────────────────────────────────────────────
+# Widest a pick photo renders (a third of the wide layout), in CSS px
+PICK_IMAGE_WIDTH = 480
+
+
+def local_variant(filename):
+    """Pre-resized variant from `python image_assets.py`, or None if the image has none."""
+    if not filename:
         return None
+    return next(filter(None, (variant_url(n, PICK_IMAGE_WIDTH) for n in image_names(filename))), None)
+
+
+def pick_images(picks):
+    """Originals of the picks without a pre-resized variant, fetched concurrently (URLs or bytes)."""
+    names = [cell(pick, "image_file") for pick in picks.to_dict("records")]
+    return image_sources([n for n in names if n and not local_variant(n)])
 
 
 # ── Helper: clean cell value ───────────────────────────────────────────────────
@@ -192,7 +125,7 @@ def cell(pick, key):
 
 
 # ── Card renderer ──────────────────────────────────────────────────────────────
-def render_pick(pick):
+def render_pick(pick, images=None):
     name = cell(pick, "name")
     brand = cell(pick, "brand")
     distillery = cell(pick, "distillery")
@@ -218,9 +151,11 @@ def render_pick(pick):
     img_col, info_col = st.columns([1, 2])
 
     with img_col:
-        img = load_image(cell(pick, "image_file"))
+        filename = cell(pick, "image_file")
+        # Pre-resized variant from `python image_assets.py`, else the original (prefetched by pick_images)
+        img = local_variant(filename) or (images or {}).get(filename) or image_source(filename)
         if img is not None:
-            st.image(img, use_container_width=True)
+            show_image(img, alt=title)
         else:
             st.markdown(
                 "<div style='width:100%;padding:60px 20px;"
@@ -322,16 +257,15 @@ def render_pick(pick):
 
 
 # ── Load & split data ──────────────────────────────────────────────────────────
-df_all = load_barrel_picks()
+df_all = load_barrel_picks(source_version("barrel_picks"))
 
 # Split based on which sheet tab the row came from — no hardcoded status values
 upcoming_df = df_all[df_all["_tab"] == "upcoming"].copy() if not df_all.empty else pd.DataFrame()
 previous_df = df_all[df_all["_tab"] == "previous"].copy() if not df_all.empty else pd.DataFrame()
 
 # ── Sidebar ────────────────────────────────────────────────────────────────────
-if st.sidebar.button("🔄 Refresh Data"):
-    st.cache_data.clear()
-    st.rerun()
+# New picks may come with labels that were missing a moment ago
+refresh_button(lambda: bump_source("barrel_picks"), on_refresh=forget_resolutions)
 
 # ── Page toggle ────────────────────────────────────────────────────────────────
 _, toggle_col = st.columns([3, 1])
@@ -344,12 +278,15 @@ with toggle_col:
 st.markdown("---")
 
 # ── Render ─────────────────────────────────────────────────────────────────────
+# Fetch every card's image at once up front, rather than one per card while drawing
+images = pick_images(upcoming_df if view == "Upcoming Picks" else previous_df)
+
 if view == "Upcoming Picks":
     if upcoming_df.empty:
         st.info("No upcoming picks announced yet — stay tuned!")
     else:
         for _, row in upcoming_df.iterrows():
-            render_pick(row.to_dict())
+            render_pick(row.to_dict(), images)
 
 else:
     if previous_df.empty:
@@ -357,4 +294,4 @@ else:
     else:
         for _, row in previous_df.iterrows():
             with st.expander(f"🛢️ {row.get('name', 'Pick')}", expanded=False):
-                render_pick(row.to_dict())
\ No newline at end of file
+                render_pick(row.to_dict(), images)
\ No newline at end of file
@@ -1,7 +1,9 @@
 import streamlit as st
 import random
 import pandas as pd
-from utils import add_sidebar_logo, get_data
+from image_assets import variant_url
+from image_cache import image_source, image_sources
+from utils import add_sidebar_logo, get_data, show_image
 
 st.set_page_config(
     page_title="About",
@@ -110,30 +112,13 @@ st.write(
     "We hope you enjoy and this helps you stay spirited."
 )
 
-# ── Image loader with graceful fallback ───────────────────────────────────────
-# Host your images on GitHub (raw URL) or drop the PNGs alongside this file.
+# ── Images ────────────────────────────────────────────────────────────────────
+# Host your images on GitHub (raw URL) or drop the PNGs alongside this file;
+# image_cache keeps them in memory and on disk between reruns.
 # If a file isn't found, a placeholder is shown instead of crashing.
-GITHUB_BASE = "https://github.com/tpfeeney/spirited-reviews/blob/main"
 
-def load_image(filename):
-    """Try GitHub raw URL first; fall back to local file; return None if both fail."""
-    import requests
-    from PIL import Image
-    from io import BytesIO
-
-    url = f"{GITHUB_BASE}/{filename}?raw=true"
-    try:
-        resp = requests.get(url, timeout=5)
-        if resp.status_code == 200:
-            return Image.open(BytesIO(resp.content))
-    except Exception:
-        pass
-
-    # Local fallback
-    try:
-        return Image.open(filename)
-    except Exception:
-        return None
+# Widest a crew photo renders (a third of half the wide layout), in CSS px
+CREW_IMAGE_WIDTH = 240
 
 
 # ── Build live top-5 HTML from data ──────────────────────────────────────────
@@ -159,16 +144,20 @@ def top5_html(reviewer_key, df):
 
 
 # ── Helper to render a person card ───────────────────────────────────────────
-def render_person(person, df=None, img_width=None):
+def crew_images(people):
+    """Originals of the people without a pre-resized variant, fetched concurrently (URLs or bytes)."""
+    return image_sources([p["image_file"] for p in people if not variant_url(p["image_file"], CREW_IMAGE_WIDTH)])
+
+
+def render_person(person, df=None, img_width=None, images=None):
     st.markdown(f"#### {person['title']}")
     pic_col, txt_col = st.columns([1, 2])
     with pic_col:
-        img = load_image(person["image_file"])
+        # Pre-resized variant from `python image_assets.py`, else the original (prefetched by crew_images)
+        img = (variant_url(person["image_file"], img_width or CREW_IMAGE_WIDTH)
+               or (images or {}).get(person["image_file"]) or image_source(person["image_file"]))
         if img is not None:
-            if img_width:
-                st.image(img, width=img_width)
-            else:
-                st.image(img, use_container_width=True)
+            show_image(img, width=img_width, alt=person["title"])
         else:
             st.markdown(
                 "<div style='width:100%;padding:40px;background:#222;"
@@ -223,17 +212,18 @@ aspiring cigar aficionado, and committed foodie with a soft spot for Asian and I
 df = get_data()
 
 random.shuffle(crew)
+images = crew_images(crew)
 
 st.subheader("🥃 The Crew")
 # Render first two in a row, then last one solo on the left
 cols = st.columns(2)
 for i, person in enumerate(crew[:2]):
     with cols[i]:
-        render_person(person, df=df)
+        render_person(person, df=df, images=images)
 if len(crew) > 2:
     cols = st.columns(2)
     with cols[0]:
-        render_person(crew[2], df=df)
+        render_person(crew[2], df=df, images=images)
 
 # ── Former Spirited Crew ──────────────────────────────────────────────────────
 # st.markdown("---")
@@ -1,12 +1,11 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from utils import add_sidebar_logo, get_data, GUEST_COLS
+from image_assets import variant_url
+from image_cache import GITHUB_BASE
+from utils import (add_sidebar_logo, filter_index, get_dataset, refresh_button, show_image, striped_table,
+                   table_window, GUEST_COLS)
+from tables import guest_table
 
 st.set_page_config(
     page_title="Spirited Guests",
@@ -109,7 +108,8 @@ add_sidebar_logo()
 
 st.title("Spirited Guests 🍶")
 
-df = get_data()
+dataset = get_dataset()
+df = dataset.view()
 
 if df is None or df.empty:
     st.error("No data available. Please return to the main page.")
@@ -122,10 +122,7 @@ if not active_guests:
     st.stop()
 
 # Only rows where at least one guest has scored
-for col in active_guests:
-    df[col] = pd.to_numeric(df[col], errors='coerce')
-
-guest_df = df[df[active_guests].notna().any(axis=1)].copy()
+guest_df = df[df['guest_avg'].notna()]
 
 if guest_df.empty:
     st.info("No reviews with guest scores yet.")
@@ -134,80 +131,17 @@ if guest_df.empty:
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 theme = st.sidebar.radio("Table theme", ["Dark", "Light"], horizontal=True)
 
-if st.sidebar.button("🔄 Refresh Data"):
-    st.cache_data.clear()
-    del st.session_state["df"]
-    st.rerun()
+refresh_button()
 
 # ══════════════════════════════════════════════════════════════════════════════
 # SECTION 1 — REVIEWS TABLE (guest columns only)
 # ══════════════════════════════════════════════════════════════════════════════
 st.header("Guest Reviews 🥃")
 
-guest_display = {c: c.capitalize() for c in active_guests}
-
-base_cols    = ["date", "link", "brand", "name"]
-tail_cols    = ["age", "proof", "price", "type"]
-display_cols = base_cols + active_guests + tail_cols
-
-display_df = guest_df[[c for c in display_cols if c in guest_df.columns]].copy()
-display_df["date"] = display_df["date"].dt.strftime("%d %B %Y")
-
-rename_map = {
-    "date": "Date", "link": "Video Link", "brand": "Brand",
-    "name": "Whiskey Name", "age": "Age", "proof": "Proof",
-    "price": "Price ($)", "type": "Type",
-    **guest_display
-}
-display_df.rename(columns=rename_map, inplace=True)
-
-guest_display_names = [guest_display[c] for c in active_guests]
-
-# Compute guest avg and median
-numeric_guests = display_df[guest_display_names].apply(pd.to_numeric, errors='coerce')
-display_df["Guest Avg"]    = numeric_guests.mean(axis=1, skipna=True).round(1)
-display_df["Guest Median"] = numeric_guests.median(axis=1, skipna=True).round(1)
-
-# Insert Guest Avg and Median right after Whiskey Name
-cols = list(display_df.columns)
-name_idx = cols.index("Whiskey Name")
-for insert_col in ["Guest Median", "Guest Avg"]:
-    cols.insert(name_idx + 1, cols.pop(cols.index(insert_col)))
-display_df = display_df[cols]
-
-if theme == "Dark":
-    odd_color  = "#1a1a1a"
-    even_color = "#2a2a2a"
-    text_color = "#eeeeee"
-else:
-    odd_color  = "#ffffff"
-    even_color = "#f2efe8"
-    text_color = "#222222"
-
-# Format columns
-for col in guest_display_names + ["Guest Avg", "Guest Median"]:
-    if col in display_df.columns:
-        display_df[col] = pd.to_numeric(display_df[col], errors='coerce').apply(
-            lambda x: f"{x:.1f}" if pd.notna(x) else "—"
-        )
-
-if "Proof" in display_df.columns:
-    display_df["Proof"] = pd.to_numeric(display_df["Proof"], errors='coerce').apply(
-        lambda x: f"{x:.1f}" if pd.notna(x) else "—"
-    )
-
-display_df["Age"] = display_df["Age"].apply(
-    lambda x: f"{float(x):.0f} yr" if pd.notna(x) and str(x) not in ('nan', '—') else "NAS"
-)
-display_df["Price ($)"] = display_df["Price ($)"].apply(
-    lambda x: f"${float(x):.0f}" if pd.notna(x) and str(x) not in ('nan', '—') else "—"
-)
-
-def color_rows(row):
-    color = odd_color if row.name % 2 == 0 else even_color
-    return [f"background-color: {color}; color: {text_color}"] * len(row)
-
-styled = display_df.reset_index(drop=True).style.apply(color_rows, axis=1)
+# Only the visible page is styled and sent, so the theme applies however many rows there are
+table = guest_table(dataset)
+start, stop = table_window("guests", len(table))
+styled = striped_table(table.slice(start, stop - start), theme)
 
 st.dataframe(
     styled,
@@ -220,8 +154,8 @@ st.dataframe(
 )
 
 with st.expander("📊 Scoring Key"):
-    st.image(
-        "https://github.com/tpfeeney/spirited-reviews/blob/main/Scoring_Sheet_Final.jpg?raw=true",
+    show_image(
+        variant_url("Scoring_Sheet_Final.jpg", 600) or f"{GITHUB_BASE}/Scoring_Sheet_Final.jpg?raw=true",
         caption="Spirited Reviews Scoring Guide",
         width=600
     )
@@ -239,9 +173,9 @@ if 'type' in guest_df.columns and not guest_df['type'].dropna().empty:
 else:
     type_option = "All Types"
 
-stats_df = guest_df.copy()
+stats_df = guest_df
 if type_option != "All Types":
-    stats_df = stats_df[stats_df['type'] == type_option]
+    stats_df = df.take(filter_index(dataset).select({"reviewer": active_guests, "type": [type_option]}))
 
 if stats_df.empty:
     st.warning("No data available for the selected type filter.")
@@ -265,6 +199,10 @@ else:
     c3.metric("Median",          f"{scores.median():.2f}")
     c4.metric("75th Percentile", f"{scores.quantile(0.75):.2f}")
 
+    # Not imported when the type filter leaves no guest scores
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
     df_melted = stats_df.melt(value_vars=active_guests, var_name='Guest', value_name='Score')
     df_melted['Guest'] = df_melted['Guest'].str.capitalize()
 
@@ -307,7 +245,7 @@ st.info(
     "then see which guest reviewer's palate matches yours most closely."
 )
 
-pick_df = guest_df.copy()
+pick_df = guest_df.copy(deep=False)
 if "select" not in pick_df.columns:
     pick_df["select"] = False
 
@@ -396,6 +334,9 @@ st.dataframe(
 )
 
 # ── Box plot comparison ───────────────────────────────────────────────────────
+import plotly.express as px
+import plotly.graph_objects as go
+
 box_df = selected_rows.reset_index()[["name"] + active_guests].melt(
     id_vars=["name"], var_name="Reviewer", value_name="Score"
 )
@@ -447,6 +388,7 @@ for g in active_guests:
         diffs[g.capitalize()] = (guest_aligned - user_common).abs().mean()
 
     if len(user_common) >= 3 and user_common.std() > 0 and guest_aligned.std() > 0:
+        from scipy import stats
         r_val, _ = stats.pearsonr(user_common.values, guest_aligned.values)
         correlations[g.capitalize()] = {"r": round(r_val, 3), "n": len(user_common)}
     elif len(user_common) >= 1:
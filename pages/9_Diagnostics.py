@@ -0,0 +1,251 @@
+import streamlit as st
+import pandas as pd
+import hmac
+import os
+import time
+from refresher import refresher_status
+from snapshot import snapshot_age
+from timings import history, history_json
+from utils import add_sidebar_logo, reviews_sync
+import warmup
+
+st.set_page_config(
+    page_title="Diagnostics",
+    page_icon="🩺",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+# ── Spirited Style ─────────────────────────────────────────────────────────────
+st.markdown("""
+<style>
+  @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@600;700&family=Source+Sans+3:wght@300;400;600&display=swap');
+
+  html, body, [class*="css"] { font-family: 'Source Sans 3', sans-serif; }
+  h1, h2, h3, h4 { font-family: 'Playfair Display', serif; }
+
+  .stApp {
+      background: linear-gradient(135deg, #1a0a00 0%, #2d1400 50%, #1a0a00 100%);
+      color: #f5e6d3;
+  }
+  [data-testid="stSidebar"] {
+      background: linear-gradient(180deg, #120600 0%, #1f0c00 100%) !important;
+      border-right: 1px solid rgba(200,100,10,0.25);
+  }
+  [data-testid="stSidebar"] label,
+  [data-testid="stSidebar"] .stRadio label,
+  [data-testid="stSidebar"] .stCheckbox label {
+      color: #f0d5b0 !important;
+      font-size: 0.95rem !important;
+  }
+  [data-testid="stSidebar"] .stMarkdown,
+  [data-testid="stSidebar"] p,
+  [data-testid="stSidebar"] span {
+      color: #f0d5b0 !important;
+  }
+  [data-testid="stSidebar"] h1,
+  [data-testid="stSidebar"] h2,
+  [data-testid="stSidebar"] h3 {
+      color: #ffd699 !important;
+  }
+  label, .stSelectbox label, .stNumberInput label, .stSlider label,
+  .stRadio label, .stCheckbox label, .stMultiSelect label {
+      color: #f0d5b0 !important;
+      font-size: 0.9rem !important;
+  }
+  p, li, span, div { color: #f5e6d3; }
+  .stNumberInput input, .stTextInput input, .stTextArea textarea {
+      background: rgba(255,220,160,0.07) !important;
+      border: 1px solid rgba(200,100,10,0.35) !important;
+      color: #ffd699 !important;
+      border-radius: 6px !important;
+  }
+  .stSelectbox > div > div, .stMultiSelect > div > div {
+      background: rgba(255,220,160,0.07) !important;
+      border: 1px solid rgba(200,100,10,0.35) !important;
+      color: #ffd699 !important;
+  }
+  .stButton > button {
+      background: linear-gradient(90deg, #7a3e00, #c8640a) !important;
+      color: #fff8ef !important;
+      border: none !important;
+      border-radius: 8px !important;
+      font-family: 'Playfair Display', serif !important;
+      font-size: 1rem !important;
+      padding: 9px 28px !important;
+      letter-spacing: 0.5px;
+      transition: opacity 0.2s;
+  }
+  .stButton > button:hover { opacity: 0.88 !important; }
+  [data-testid="stMetric"] {
+      background: linear-gradient(135deg, rgba(200,100,10,0.12), rgba(120,60,0,0.18));
+      border: 1px solid rgba(200,100,10,0.3);
+      border-radius: 10px;
+      padding: 12px 16px;
+  }
+  [data-testid="stMetricLabel"] { color: #d4956a !important; font-size: 0.8rem !important; }
+  [data-testid="stMetricValue"] { color: #ffd699 !important; font-family: 'Playfair Display', serif !important; }
+  [data-testid="stDataFrame"] { border: 1px solid rgba(200,100,10,0.2) !important; border-radius: 8px; }
+  .streamlit-expanderHeader {
+      background: rgba(255,220,160,0.06) !important;
+      border: 1px solid rgba(200,100,10,0.2) !important;
+      border-radius: 8px !important;
+      color: #f5a944 !important;
+  }
+  .stAlert { border-radius: 8px !important; }
+  hr { border-color: rgba(200,100,10,0.2) !important; }
+  #MainMenu { visibility: hidden; }
+  footer { visibility: hidden; }
+</style>
+""", unsafe_allow_html=True)
+
+add_sidebar_logo()
+
+st.title("🩺 Diagnostics")
+st.caption("Health of the background data refreshers, the boot warm-up, and where data loads spend their time.")
+
+# ── Access ─────────────────────────────────────────────────────────────────────
+# Raw refresh errors and load timings are for whoever runs the app, not visitors
+DIAGNOSTICS_TOKEN = os.environ.get("SPIRITED_DIAGNOSTICS_TOKEN")
+if not DIAGNOSTICS_TOKEN:
+    st.info("Diagnostics is turned off. Set SPIRITED_DIAGNOSTICS_TOKEN on the server to turn it on.")
+    st.stop()
+
+token = st.text_input("Diagnostics token", type="password")
+if not hmac.compare_digest(token.encode(), DIAGNOSTICS_TOKEN.encode()):
+    if token:
+        st.error("That token doesn't match.")
+    st.stop()
+
+# ── Refreshers ─────────────────────────────────────────────────────────────────
+def fmt_age(seconds):
+    if seconds is None:
+        return "—"
+    if seconds < 120:
+        return f"{seconds:.0f} s"
+    return f"{seconds / 60:.0f} min"
+
+
+def fmt_time(ts):
+    return "—" if ts is None else time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+
+
+statuses = refresher_status()
+if not statuses:
+    st.info("No data has been loaded in this server process yet.")
+    st.stop()
+
+rows = [
+    {
+        "Dataset":        s["name"],
+        "Data Age":       fmt_age(s["age_seconds"]),
+        "Refresh Every":  fmt_age(s["interval"]),
+        "Refreshes":      s["refreshes"],
+        "Failures":       s["failures"],
+        "Last Attempt":   fmt_time(s["last_attempt"]),
+        "Last Error":     s["last_error"] or "",
+        "Last Error At":  fmt_time(s["last_error_at"]),
+        "Thread Running": s["thread_alive"],
+    }
+    for s in statuses
+]
+st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+for s in statuses:
+    if s["last_error"]:
+        st.error(f"**{s['name']}** is serving its last good copy — last refresh failed: {s['last_error']}")
+
+# ── Sheet sync ─────────────────────────────────────────────────────────────────
+st.header("Sheet Sync")
+st.caption("The snapshot is only rewritten when a sync finds new data, so it can be older than the last sync. "
+           "Last Sync shows — until this server process has synced once.")
+sync_cols = st.columns(3)
+sync_cols[0].metric("Snapshot Age", fmt_age(snapshot_age(reviews_sync.name)))
+sync_cols[1].metric("Last Synced", fmt_time(reviews_sync.meta.get("synced_at")))
+sync_cols[2].metric("Last Sync", {None: "—", True: "New data", False: "Unchanged"}[reviews_sync.changed])
+
+# ── Boot warm-up ───────────────────────────────────────────────────────────────
+boot = warmup.status()
+if boot["started_at"] is not None:
+    st.header("Boot Warm-up")
+    if boot["ready"]:
+        st.success(f"Ready — warmed up in {boot['finished_at'] - boot['started_at']:.1f} s "
+                   f"(started {fmt_time(boot['started_at'])})")
+    elif boot["finished_at"] is None:
+        st.info(f"Warming up since {fmt_time(boot['started_at'])} — /ready answers 503 until done")
+    else:
+        st.error("A required warm-up step failed and is being retried — /ready answers 503 until it succeeds")
+    st.dataframe(
+        pd.DataFrame([
+            {"Step": s["step"], "Seconds": s["seconds"], "Required": s["required"], "Attempts": s["attempts"],
+             "Error": s["error"] or ""}
+            for s in boot["steps"]
+        ]),
+        hide_index=True, use_container_width=True,
+    )
+
+
+# ── Load timings ───────────────────────────────────────────────────────────────
+st.header("Load Timings")
+
+loads = history()
+if not loads:
+    st.info("No loads have been timed yet.")
+    st.stop()
+
+
+def fmt_bytes(n):
+    if n is None or pd.isna(n):
+        return "—"
+    if n < 1024 * 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n / 1024 / 1024:.1f} MB"
+
+
+def stage_rows(load):
+    return [
+        {
+            "Stage":   s["stage"],
+            "Seconds": s["seconds"],
+            "Rows":    s.get("rows"),
+            "Size":    fmt_bytes(s.get("bytes")),
+        }
+        for s in load["stages"]
+    ]
+
+
+latest = loads[-1]
+st.subheader(f"Latest: {latest['dataset']} {latest['kind']} at {fmt_time(latest['started_at'])} "
+             f"— {latest['seconds']:.2f} s")
+if latest["error"]:
+    st.error(f"Failed: {latest['error']}")
+st.dataframe(pd.DataFrame(stage_rows(latest)), hide_index=True, use_container_width=True)
+
+# One row per load, one column per stage, so a regressing stage stands out
+history_df = pd.DataFrame([
+    {
+        "Started": pd.to_datetime(l["started_at"], unit="s"),
+        "Dataset": l["dataset"],
+        "Kind":    l["kind"],
+        "Total":   l["seconds"],
+        **{s["stage"]: s["seconds"] for s in l["stages"]},
+        "Rows":    max((s.get("rows") or 0 for s in l["stages"]), default=0),
+        "Error":   l["error"] or "",
+    }
+    for l in loads
+])
+
+st.subheader(f"History (last {len(loads)} loads)")
+refreshes = history_df[history_df["Kind"] == "refresh"]
+if len(refreshes) > 1:
+    stage_cols = [c for c in refreshes.columns
+                  if c not in ("Started", "Dataset", "Kind", "Total", "Rows", "Error")]
+    st.line_chart(refreshes.set_index("Started")[stage_cols])
+st.dataframe(history_df.iloc[::-1], hide_index=True, use_container_width=True)
+
+st.download_button(
+    "⬇️ Download timings JSON",
+    data=history_json(),
+    file_name="load_timings.json",
+    mime="application/json",
+)
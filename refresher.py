@@ -0,0 +1,133 @@
+"""Stale-while-revalidate refreshers for process-wide datasets.
+
+A BackgroundRefresher always answers get() from memory. A daemon thread
+reloads the value on a fixed interval and swaps it in once the reload has
+finished. If a reload fails, the last good value keeps being served and the
+error is recorded for the diagnostics page.
+"""
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# Every refresher ever created, by name, so their status can be monitored
+REFRESHERS = {}
+
+
+class BackgroundRefresher:
+    def __init__(self, name, load, interval, initial=None, retry_interval=60):
+        """
+        name           – key in REFRESHERS and in status reports
+        load           – zero-arg callable returning a fresh value; may raise
+        interval       – seconds between successful refreshes
+        initial        – optional zero-arg callable returning (value, age_seconds)
+                         to serve before the first load, e.g. a disk snapshot
+        retry_interval – seconds to wait after a failed refresh
+        """
+        self.name = name
+        self.load = load
+        self.interval = interval
+        self.retry_interval = retry_interval
+        self._initial = initial
+
+        self._value = None
+        self._loaded_at = None          # time.time() of the data currently served
+        self.last_attempt = None
+        self.last_error = None
+        self.last_error_at = None
+        self.refreshes = 0
+        self.failures = 0
+
+        self._lock = threading.Lock()   # serialises loads
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        REFRESHERS[name] = self
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+    def get(self):
+        """Return the current value, loading it synchronously only if there is none yet."""
+        if self._value is None:
+            with self._lock:
+                if self._value is None and self._initial is not None:
+                    self._seed_from_initial()
+            if self._value is None:
+                self.refresh(only_if_empty=True)
+            if self._value is None:
+                raise RuntimeError(f"{self.name}: no data available ({self.last_error})")
+        self._ensure_thread()
+        return self._value
+
+    @property
+    def age(self):
+        """Seconds since the served value was loaded, or None."""
+        return None if self._loaded_at is None else time.time() - self._loaded_at
+
+    def status(self):
+        return {
+            "name":           self.name,
+            "age_seconds":    None if self.age is None else round(self.age, 1),
+            "interval":       self.interval,
+            "refreshes":      self.refreshes,
+            "failures":       self.failures,
+            "last_attempt":   self.last_attempt,
+            "last_error":     self.last_error,
+            "last_error_at":  self.last_error_at,
+            "thread_alive":   self._thread is not None and self._thread.is_alive(),
+        }
+
+    # ── Refreshing ───────────────────────────────────────────────────────────
+    def refresh(self, only_if_empty=False):
+        """Reload now, blocking the caller. Returns True if fresh data was swapped in."""
+        with self._lock:
+            if only_if_empty and self._value is not None:
+                return True
+            self.last_attempt = time.time()
+            try:
+                value = self.load()
+            except Exception as e:
+                self.failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                self.last_error_at = time.time()
+                log.warning("Refreshing %s failed; serving last good copy: %s", self.name, e)
+                return False
+            self._value, self._loaded_at = value, time.time()
+            self.refreshes += 1
+            self.last_error = None
+            return True
+
+    def _seed_from_initial(self):
+        try:
+            seeded = self._initial()
+        except Exception as e:
+            log.warning("Could not seed %s: %s", self.name, e)
+            return
+        if seeded is not None and seeded[0] is not None:
+            value, age = seeded
+            self._value = value
+            self._loaded_at = time.time() - (age or 0)
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"refresh-{self.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            if self.last_error is not None:
+                delay = self.retry_interval
+            else:
+                delay = self.interval - (self.age or self.interval)
+            if delay > 0:
+                time.sleep(delay)
+            self.refresh()
+
+
+def refresher_status():
+    """Status dicts for every refresher, for monitoring."""
+    return [r.status() for r in REFRESHERS.values()]
@@ -0,0 +1,153 @@
+"""Prebuilt search over brand and whiskey name.
+
+The index is built once per dataset version over the distinct "brand name"
+strings, so repeated bottles and brands cost nothing extra:
+
+    vocabulary   sorted array of every token; a prefix is a searchsorted range
+    postings     token → ids of the distinct strings containing it, laid out
+                 so a prefix range is one slice
+    trigrams     trigram → word token ids, to find near-miss tokens for typos
+
+A query is split into terms. Each term matches the tokens it prefixes or, if
+there are none, tokens within a small edit distance of it ("weler" finds
+"weller"). A row must match every term. search() returns frame row
+positions, ready to feed a table window.
+"""
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Sorts after every token character, so [term, term + _PREFIX_END) spans all tokens starting with term
+_PREFIX_END = "{"
+
+# Longest candidate list checked by edit distance per fuzzy term
+_FUZZY_CANDIDATES = 64
+
+
+def tokenize(text):
+    """Lower-case ASCII word tokens; apostrophes are dropped so "Maker's" → "makers"."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return _TOKEN_RE.findall(text.lower().replace("'", ""))
+
+
+def _trigrams(token):
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _max_edits(term):
+    return 0 if len(term) < 4 or term.isdigit() else 1 if len(term) < 8 else 2
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it's certain to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class SearchIndex:
+    def __init__(self, texts):
+        """texts – one searchable string per frame row, in row order."""
+        texts = pd.Series(texts).fillna("").astype(str)
+        self._codes, docs = pd.factorize(texts)      # row → distinct string ("doc")
+        self.n_docs = len(docs)
+
+        postings = defaultdict(list)
+        for doc_id, text in enumerate(docs):
+            for token in set(tokenize(text)):
+                postings[token].append(doc_id)
+        self.vocabulary = np.array(sorted(postings), dtype=object)
+
+        # Postings laid end to end in vocabulary order, so the docs of a run of
+        # tokens (e.g. everything with one prefix) are one contiguous slice
+        lengths = np.array([len(postings[t]) for t in self.vocabulary], dtype=np.int64)
+        self._token_start = np.concatenate([[0], np.cumsum(lengths)])
+        self._flat_postings = np.fromiter(
+            (d for t in self.vocabulary for d in postings[t]), dtype=np.int64, count=int(lengths.sum())
+        )
+
+        # Typos are looked up through trigrams of word tokens; numbers only match by prefix
+        grams = defaultdict(list)
+        for token_id, token in enumerate(self.vocabulary):
+            if not token.isdigit():
+                for gram in _trigrams(token):
+                    grams[gram].append(token_id)
+        self._trigrams = {g: np.array(ids, dtype=np.int64) for g, ids in grams.items()}
+
+    @classmethod
+    def from_frame(cls, df, columns=("brand", "name")):
+        texts = df[columns[0]].astype(str).str.cat([df[c].astype(str) for c in columns[1:]], sep=" ", na_rep="")
+        return cls(texts)
+
+    # ── Matching ─────────────────────────────────────────────────────────────
+    def _prefix_range(self, term):
+        lo = np.searchsorted(self.vocabulary, term, side="left")
+        hi = np.searchsorted(self.vocabulary, term + _PREFIX_END, side="left")
+        return lo, hi
+
+    def _fuzzy_tokens(self, term):
+        """Tokens that start with something within _max_edits(term) edits of term."""
+        limit = _max_edits(term)
+        hits = [self._trigrams[g] for g in _trigrams(term) if g in self._trigrams]
+        if not limit or not hits:
+            return []
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.vocabulary))
+        # Each edit breaks at most three trigrams; the trailing "$" gram may not match a longer token
+        need = max(1, len(term) - 3 * limit - 1)
+        candidates = np.flatnonzero(shared >= need)
+        if len(candidates) > _FUZZY_CANDIDATES:
+            candidates = candidates[np.argsort(-shared[candidates], kind="stable")[:_FUZZY_CANDIDATES]]
+
+        matched = []
+        for token_id in candidates:
+            token = self.vocabulary[token_id]
+            lengths = range(max(1, len(term) - limit), min(len(token), len(term) + limit) + 1)
+            if any(_edit_distance(term, token[:k], limit) <= limit for k in lengths):
+                matched.append(token_id)
+        return matched
+
+    def _term_docs(self, term):
+        """Boolean mask over docs containing a token that `term` prefixes.
+
+        Falls back to near-miss tokens only when nothing starts with `term`, so
+        "weler" finds "weller" but "maker" doesn't also drag in "bakers".
+        """
+        docs = np.zeros(self.n_docs, dtype=bool)
+        lo, hi = self._prefix_range(term)
+        if hi > lo:
+            docs[self._flat_postings[self._token_start[lo]:self._token_start[hi]]] = True
+        else:
+            for t in self._fuzzy_tokens(term):
+                docs[self._flat_postings[self._token_start[t]:self._token_start[t + 1]]] = True
+        return docs
+
+    def search(self, query):
+        """Sorted row positions matching every term of `query`, or None for an empty query."""
+        terms = tokenize(query)
+        if not terms:
+            return None
+        docs = self._term_docs(terms[0])
+        for term in terms[1:]:
+            if not docs.any():
+                break
+            docs &= self._term_docs(term)
+        return np.flatnonzero(docs[self._codes])
+
+
+def search_index(dataset):
+    """The dataset's SearchIndex, built on first use and kept for the dataset's lifetime."""
+    return dataset.memo("search_index", SearchIndex.from_frame)
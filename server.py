@@ -0,0 +1,62 @@
+"""Server entry point: the app, plus a cache warm-up at boot and a readiness route.
+
+    streamlit run server.py                 # or: uvicorn server:app --port 8501
+
+Streamlit's own /_stcore/health says the process is up. /ready answers 503
+with the warm-up's progress until the data and caches are hot, then 200.
+Point the load balancer's health check at /ready.
+
+Files under /app/static/ also get Cache-Control headers here (Streamlit
+sends none). The image variants and cached images have content hashes in
+their names, so browsers keep them for a year.
+"""
+import re
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+import warmup
+
+# image_assets.py variants (name-<hash>-<width>.webp) and image_cache copies (name-<hash>.ext)
+HASHED_STATIC = re.compile(r"/app/static/.*-[0-9a-f]{16}(-\d+)?\.[A-Za-z]+$")
+IMMUTABLE = b"public, max-age=31536000, immutable"
+REVALIDATE = b"public, max-age=3600"
+
+
+class StaticCacheHeaders:
+    """ASGI middleware adding Cache-Control to successful /app/static/ responses."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "") if scope["type"] == "http" else ""
+        if "/app/static/" not in path:
+            await self.app(scope, receive, send)
+            return
+        value = IMMUTABLE if HASHED_STATIC.search(path) else REVALIDATE
+
+        async def send_with_cache_control(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message = {**message, "headers": [*message.get("headers", []), (b"cache-control", value)]}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    warmup.start()
+    yield
+
+
+async def ready(request):
+    status = warmup.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
+app = st.App("Spirited_Reviews.py", lifespan=lifespan, routes=[Route("/ready", ready)],
+             middleware=[Middleware(StaticCacheHeaders)])
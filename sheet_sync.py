@@ -0,0 +1,185 @@
+"""Change-detecting sync of a data source into a local snapshot.
+
+CSV sources (Google Sheets exports, local CSV files) are checked with the
+last ETag / Last-Modified validators, and their raw bytes are hashed. An
+unchanged sheet skips parsing and cleaning entirely and hands back the frame
+already in memory. A sheet that only gained rows at the bottom has just those
+rows parsed, cleaned and appended. Frame sources (Parquet, SQLite) are hashed
+after reading and re-cleaned only when their contents differ.
+"""
+import hashlib
+import io
+import logging
+import time
+
+import pandas as pd
+
+from singleflight import flights
+from snapshot import read_meta, read_snapshot, write_meta, write_snapshot
+from timings import stage
+
+log = logging.getLogger(__name__)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def frame_digest(df):
+    """Content hash of a raw frame, for sources that don't hand us bytes."""
+    h = hashlib.sha256(",".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+class SheetSync:
+    """Keeps the cleaned snapshot `name` in step with `source`.
+
+    `clean` takes a raw frame and returns the cleaned frame. It must work row
+    by row, since appended rows are cleaned on their own.
+    """
+
+    def __init__(self, name, source, clean):
+        self.name = name
+        self.source = source
+        self.clean = clean
+        self.changed = None      # did the last sync() produce new data? None before the first
+        self._frame = None
+        self._meta = None
+        self._snapshot_pending = False   # is the frame in memory newer than the snapshot on disk?
+
+    @property
+    def version(self):
+        """SHA-256 of the raw data the current frame was built from."""
+        return self.meta.get("sha256")
+
+    @property
+    def meta(self):
+        if self._meta is None:
+            self._meta = read_meta(self.name)
+        return self._meta
+
+    @property
+    def synced_age(self):
+        """Seconds since the source was last checked successfully, or None."""
+        synced_at = self.meta.get("synced_at")
+        return None if synced_at is None else time.time() - synced_at
+
+    def current(self):
+        """The last synced frame (from memory, else the on-disk snapshot), or None.
+
+        A snapshot written from a different source is ignored.
+        """
+        if self._frame is None and self.meta.get("source", self.source.spec) == self.source.spec:
+            self._frame = read_snapshot(self.name)
+        return self._frame
+
+    def sync(self):
+        """Fetch the source and return the cleaned frame, reusing work where possible.
+
+        Concurrent callers share a single fetch.
+        """
+        return flights.do(("sync", self.name), self._sync)
+
+    def _sync(self):
+        previous = self.current()
+        meta = dict(self.meta) if previous is not None else {}
+        if self.source.csv:
+            return self._sync_csv(previous, meta)
+
+        with stage("fetch") as rec:
+            raw_frame = self.source.read_frame()
+            rec.set(rows=len(raw_frame), bytes=raw_frame.memory_usage(deep=True).sum())
+        with stage("hash"):
+            digest = frame_digest(raw_frame)
+        if previous is not None and digest == meta.get("sha256"):
+            return self._unchanged(previous, meta)
+        return self._store(self.clean(raw_frame), {"sha256": digest})
+
+    def _sync_csv(self, previous, meta):
+        with stage("fetch") as rec:
+            fetched = self.source.fetch_csv(meta.get("etag"), meta.get("last_modified"))
+            rec.set(bytes=len(fetched.content or b""))
+        validators = {"etag": fetched.etag, "last_modified": fetched.last_modified}
+        if fetched.content is None and previous is not None:
+            return self._unchanged(previous, meta)
+
+        raw = fetched.content
+        with stage("hash", bytes=len(raw)):
+            digest = _sha256(raw)
+        if previous is not None and digest == meta.get("sha256"):
+            return self._unchanged(previous, {**meta, **validators})
+
+        df = None
+        if previous is not None:
+            df = self._append_only(previous, raw, meta)
+        if df is None:
+            df = self.clean(self._parse(raw))
+        return self._store(df, {"sha256": digest, "raw_len": len(raw), **validators})
+
+    def _append_only(self, previous, raw, meta):
+        """Clean just the rows appended since the last sync, or None if it wasn't a pure append."""
+        old_len = meta.get("raw_len")
+        if not old_len or len(raw) <= old_len or _sha256(raw[:old_len]) != meta.get("sha256"):
+            return None
+        # The old export must end on a row boundary for the tail to be whole rows
+        if raw[old_len - 1:old_len] != b"\n" and raw[old_len:old_len + 1] not in (b"\n", b"\r"):
+            return None
+
+        header = raw[:raw.index(b"\n") + 1]
+        tail = raw[old_len:].lstrip(b"\r\n")
+        if not tail.strip():
+            return previous
+        try:
+            new_rows = self.clean(self._parse(header + tail))
+        except Exception as e:
+            log.info("Falling back to a full re-parse of %s: %s", self.name, e)
+            return None
+        if list(new_rows.columns) != list(previous.columns):
+            return None
+        # Cleaned on their own, the new rows can infer other dtypes (int for float,
+        # text in a numeric column). Cast them to the snapshot's, and fall back if
+        # that fails or changes a value, since mixed columns can't be snapshotted.
+        try:
+            cast = new_rows.astype(previous.dtypes.to_dict())
+            lossless = cast.astype(new_rows.dtypes.to_dict()).equals(new_rows)
+        except (TypeError, ValueError):
+            lossless = False
+        if not lossless:
+            log.info("Falling back to a full re-parse of %s: appended rows don't fit its dtypes", self.name)
+            return None
+        log.info("Appended %d new rows to %s", len(new_rows), self.name)
+        return pd.concat([previous, cast], ignore_index=True)
+
+    @staticmethod
+    def _parse(raw):
+        with stage("parse", bytes=len(raw)) as rec:
+            df = pd.read_csv(io.BytesIO(raw))
+            rec.set(rows=len(df))
+        return df
+
+    def _unchanged(self, previous, meta):
+        self.changed = False
+        if self._snapshot_pending:
+            self._write_snapshot(previous)
+        self._save_meta(meta)
+        return previous
+
+    def _store(self, df, meta):
+        self.changed = True
+        self._frame = df
+        self._write_snapshot(df)
+        self._save_meta(meta)
+        return df
+
+    def _write_snapshot(self, df):
+        with stage("snapshot", rows=len(df)):
+            self._snapshot_pending = not write_snapshot(self.name, df)
+
+    def _save_meta(self, meta):
+        meta = {**meta, "source": self.source.spec, "synced_at": time.time()}
+        self._meta = meta
+        # The meta on disk must describe the snapshot on disk. Otherwise a restart
+        # would take an older snapshot for the current sheet and never catch up.
+        if not self._snapshot_pending:
+            write_meta(self.name, meta)
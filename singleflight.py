@@ -0,0 +1,55 @@
+"""Single-flight request coalescing.
+
+When many sessions ask for the same thing at once (a cold cache after a
+popular link is shared), only the first caller does the work. Everyone else
+waits for that call and gets its result or its exception.
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Run fn() unless a call for `key` is already in flight, in which case wait for it."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+# Shared by every fetch in the process so identical keys coalesce across modules
+flights = SingleFlight()
+
+
+def http_get(url, timeout=5):
+    """requests.get(url) with concurrent callers for the same URL sharing one request."""
+    import requests
+    return flights.do(("GET", url), lambda: requests.get(url, timeout=timeout))
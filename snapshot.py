@@ -0,0 +1,92 @@
+"""Local Parquet snapshots of cleaned sheet data.
+
+A snapshot is the last good copy of a dataset written to disk after a
+successful fetch. A freshly started server reads it back in milliseconds
+instead of waiting on a Google Sheets export and a full CSV parse.
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+# Override with SPIRITED_CACHE_DIR to keep snapshots outside the checkout
+SNAPSHOT_DIR = os.environ.get(
+    "SPIRITED_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"),
+)
+
+
+def snapshot_path(name):
+    return os.path.join(SNAPSHOT_DIR, f"{name}.parquet")
+
+
+def read_snapshot(name):
+    """Return the snapshot frame for `name`, or None if there isn't a usable one."""
+    path = snapshot_path(name)
+    if not os.path.exists(path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception as e:
+        log.warning("Ignoring unreadable snapshot %s: %s", path, e)
+        return None
+
+
+def write_snapshot(name, df):
+    """Atomically replace the snapshot for `name`. Returns whether it was written.
+
+    Failures are logged, never raised; the previous snapshot is left in place.
+    """
+    path = snapshot_path(name)
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=SNAPSHOT_DIR, prefix=f".{name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    except Exception as e:
+        log.warning("Could not write snapshot %s: %s", path, e)
+        return False
+    return True
+
+
+def snapshot_age(name):
+    """Seconds since the snapshot for `name` was written, or None if missing."""
+    try:
+        return time.time() - os.path.getmtime(snapshot_path(name))
+    except OSError:
+        return None
+
+
+def meta_path(name):
+    return os.path.join(SNAPSHOT_DIR, f"{name}.json")
+
+
+def read_meta(name):
+    """Return the sync metadata stored alongside a snapshot ({} if none)."""
+    try:
+        with open(meta_path(name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_meta(name, meta):
+    path = meta_path(name)
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning("Could not write snapshot metadata %s: %s", path, e)
@@ -0,0 +1,146 @@
+"""The formatted display tables the reviews and guest pages render.
+
+Each depends only on the data, so it is built once per dataset version and
+kept on the Dataset as Arrow (see utils.arrow_table). They live here rather
+than in the pages so the boot warm-up can build them before anyone visits.
+The Distillery Ranks brand averages depend on the page's filters too, and are
+cached per filter choice; the warm-up builds the default one.
+"""
+import pandas as pd
+
+from utils import arrow_table, filter_index, format_values, GUEST_COLS, REVIEWER_COLS
+
+# Brands the Distillery Ranks page counts as legacy distilleries
+LEGACY_BRANDS = [
+    "Jack Daniel's", "Heaven Hill", "Jim Beam", "Bardstown", "Maker's Mark",
+    "Wild Turkey", "Buffalo Trace", "Four Roses", "MGP",
+    "Old Forester", "Willett"
+]
+
+
+def _build_reviews_table(df):
+    active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
+    reviewer_display = {c: c.capitalize() for c in active_reviewers}
+    reviewer_display_names = [reviewer_display[c] for c in active_reviewers]
+
+    base_cols  = ["date", "link", "brand", "name", "avg", "score"]
+    tail_cols  = ["age", "proof", "price", "type"]
+    display_cols = base_cols + active_reviewers + tail_cols
+
+    display_df = df[[c for c in display_cols + ["date_label", "median"] if c in df.columns]]
+    display_df["date"] = display_df.pop("date_label")
+
+    # Rename to display-friendly headers
+    rename_map = {
+        "date": "Date", "link": "Video Link", "brand": "Brand",
+        "name": "Whiskey Name", "avg": "Avg Score", "score": "Verdict",
+        "age": "Age", "proof": "Proof", "price": "Price ($)", "type": "Type",
+        "median": "Median Score",
+        **reviewer_display
+    }
+    display_df = display_df.rename(columns=rename_map)
+
+    # Insert Median Score right after Avg Score
+    cols = list(display_df.columns)
+    avg_idx = cols.index("Avg Score")
+    cols.insert(avg_idx + 1, cols.pop(cols.index("Median Score")))
+    display_df = display_df[cols]
+
+    # ── Pre-format columns as strings so Streamlit never renders "None" ───────
+    # Numeric score columns → "6.5" or "—"
+    for col in reviewer_display_names + ["Avg Score", "Median Score"]:
+        if col in display_df.columns:
+            display_df[col] = format_values(display_df[col], "{:.1f}")
+
+    # Age → "12 yr" or "NAS"
+    display_df["Age"] = format_values(display_df["Age"], "{:.0f} yr", missing="NAS")
+
+    # Proof → "117.3" or "—"
+    if "Proof" in display_df.columns:
+        display_df["Proof"] = format_values(display_df["Proof"], "{:.1f}")
+
+    # Price → "$45" or "—"
+    display_df["Price ($)"] = format_values(display_df["Price ($)"], "${:.0f}")
+    return display_df.reset_index(drop=True)
+
+
+def _build_guest_table(df):
+    active_guests = [c for c in GUEST_COLS if c in df.columns]
+    guest_display = {c: c.capitalize() for c in active_guests}
+    guest_display_names = [guest_display[c] for c in active_guests]
+
+    guest_df = df[df['guest_avg'].notna()]
+
+    base_cols    = ["date", "link", "brand", "name"]
+    tail_cols    = ["age", "proof", "price", "type"]
+    display_cols = base_cols + active_guests + tail_cols
+
+    display_df = guest_df[[c for c in display_cols + ["date_label", "guest_avg", "guest_median"] if c in guest_df.columns]]
+    display_df["date"] = display_df.pop("date_label")
+
+    rename_map = {
+        "date": "Date", "link": "Video Link", "brand": "Brand",
+        "name": "Whiskey Name", "age": "Age", "proof": "Proof",
+        "price": "Price ($)", "type": "Type",
+        "guest_avg": "Guest Avg", "guest_median": "Guest Median",
+        **guest_display
+    }
+    display_df = display_df.rename(columns=rename_map)
+
+    # Insert Guest Avg and Median right after Whiskey Name
+    cols = list(display_df.columns)
+    name_idx = cols.index("Whiskey Name")
+    for insert_col in ["Guest Median", "Guest Avg"]:
+        cols.insert(name_idx + 1, cols.pop(cols.index(insert_col)))
+    display_df = display_df[cols]
+
+    # Format columns
+    for col in guest_display_names + ["Guest Avg", "Guest Median"]:
+        if col in display_df.columns:
+            display_df[col] = format_values(display_df[col], "{:.1f}")
+
+    if "Proof" in display_df.columns:
+        display_df["Proof"] = format_values(display_df["Proof"], "{:.1f}")
+
+    display_df["Age"] = format_values(display_df["Age"], "{:.0f} yr", missing="NAS")
+    display_df["Price ($)"] = format_values(display_df["Price ($)"], "${:.0f}")
+    return display_df.reset_index(drop=True)
+
+
+def reviews_table(dataset):
+    """The main page's table: every published review, formatted for display."""
+    return arrow_table(dataset, "main_table", _build_reviews_table)
+
+
+def guest_table(dataset):
+    """The guest page's table: reviews with at least one guest score."""
+    return arrow_table(dataset, "guest_table", _build_guest_table)
+
+
+def brand_rows(dataset, legacy_only=False, type_option="All Types"):
+    """Positions of the reviews the Distillery Ranks filters keep, or None for all of them."""
+    return filter_index(dataset).select({
+        "brand": LEGACY_BRANDS if legacy_only else None,
+        "type": [type_option] if type_option != "All Types" else None,
+    })
+
+
+def brand_averages(dataset, columns, legacy_only=False, type_option="All Types"):
+    """Distillery Ranks' table: per-brand means of `columns` and review counts, best first."""
+    columns = list(columns)
+
+    def build(df):
+        rows = brand_rows(dataset, legacy_only, type_option)
+        if rows is not None:
+            df = df.take(rows)
+        grouped = df.groupby('brand', observed=True)[columns].mean().reset_index()
+        review_counts = df.groupby('brand', observed=True).size().reset_index(name='# of Reviews')
+        grouped = pd.merge(grouped, review_counts, on='brand', how='left')
+
+        rename_dict = {r: ("Overall Avg" if r == 'avg' else f"{r.capitalize()} Avg") for r in columns}
+        grouped.rename(columns=rename_dict, inplace=True)
+
+        sort_col = "Overall Avg" if "Overall Avg" in grouped.columns else grouped.columns[1]
+        return grouped.round(2).sort_values(by=sort_col, ascending=False).reset_index(drop=True)
+
+    return dataset.memo(("brand_averages", tuple(columns), legacy_only, type_option), build)
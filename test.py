@@ -1,9 +1,7 @@
-import pandas as pd
+from data_sources import configured_source
 
 def load_data():
-    # Replace with your actual data source
-    sheet_id = "1IwIjlnjvY2C5kLGN6gKBIp--y2f7MOipyp3e1LcVu1M"
-    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
-    return pd.read_csv(url)
+    # Set SPIRITED_SCRATCH_SOURCE to point this at another sheet or a local file
+    return configured_source("scratch").read_frame()
 
 df = load_data()
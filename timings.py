@@ -0,0 +1,93 @@
+"""Stage-level timings for data loads.
+
+A load (one refresh of a dataset) is wrapped in trace(). Code anywhere below
+it — the sync, the cleaning, the publish step — marks its stages with
+stage(), recording wall time plus row and byte counts. Outside a trace,
+stage() does nothing, so the cleaning functions can be reused freely in
+benchmarks.
+
+The last HISTORY_SIZE loads are kept in memory and saved next to the
+snapshots so the history survives restarts. The Diagnostics page shows them,
+and history_json() dumps them for tracking regressions as the sheet grows.
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from snapshot import read_meta, write_meta
+
+log = logging.getLogger(__name__)
+
+HISTORY_SIZE = 200
+HISTORY_NAME = "load_timings"
+
+_local = threading.local()
+_lock = threading.Lock()
+_history = deque(read_meta(HISTORY_NAME).get("loads", []), maxlen=HISTORY_SIZE)
+
+
+class _Stage(dict):
+    """One stage's record. Callers fill in rows/bytes once they know them."""
+
+    def set(self, rows=None, bytes=None):
+        if rows is not None:
+            self["rows"] = int(rows)
+        if bytes is not None:
+            self["bytes"] = int(bytes)
+
+
+@contextmanager
+def trace(dataset, kind="refresh"):
+    """Record every stage() run inside this block as one load of `dataset`.
+
+    `kind` tells a refresh from the sheet apart from e.g. a start-up snapshot read.
+    """
+    load = {"dataset": dataset, "kind": kind, "started_at": time.time(), "stages": [], "error": None}
+    outer = getattr(_local, "load", None)
+    _local.load = load
+    t0 = time.perf_counter()
+    try:
+        yield load
+    except Exception as e:
+        load["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        load["seconds"] = round(time.perf_counter() - t0, 4)
+        _local.load = outer
+        _record(load)
+
+
+@contextmanager
+def stage(name, rows=None, bytes=None):
+    """Time one stage of the current load. Yields a record whose rows/bytes can be set with .set()."""
+    record = _Stage(stage=name)
+    record.set(rows, bytes)
+    load = getattr(_local, "load", None)
+    t0 = time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["seconds"] = round(time.perf_counter() - t0, 4)
+        if load is not None:
+            load["stages"].append(dict(record))
+
+
+def _record(load):
+    with _lock:
+        _history.append(load)
+        snapshot = list(_history)
+    write_meta(HISTORY_NAME, {"loads": snapshot})
+
+
+def history(dataset=None):
+    """Recorded loads, oldest first, optionally for one dataset only."""
+    with _lock:
+        loads = list(_history)
+    return [l for l in loads if dataset is None or l["dataset"] == dataset]
+
+
+def history_json(dataset=None):
+    return json.dumps(history(dataset), indent=2)
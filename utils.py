@@ -1,7 +1,22 @@
+import functools
+import re
+import threading
+import time
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 
+from data_sources import configured_source
+from dataset import Dataset, content_version
+from filters import FilterIndex
+from image_assets import image_html, variant_url
+from image_cache import GITHUB_BASE
+from refresher import BackgroundRefresher
+from search import search_index
+from sheet_sync import SheetSync
+from timings import stage, trace
+
 # ── Single source of truth for reviewer columns ───────────────────────────────
 # Core crew — shown on main stats, visuals, and find-your-reviewer pages
 REVIEWER_COLS = ['randy', 'norm', 'zach']
@@ -10,23 +25,48 @@ REVIEWER_COLS = ['randy', 'norm', 'zach']
 GUEST_COLS = ['josh', 'nathan', 'bogzilla', 'chrisj', 'david' , 'justin', 'tim']
 
 
+# The sidebar shows the logo 150px wide
+LOGO_WIDTH = 150
+
+
 def add_sidebar_logo():
+    logo = variant_url("srlogo.png", LOGO_WIDTH) or f"{GITHUB_BASE}/srlogo.png?raw=true"
     st.markdown(
-        """
+        f"""
         <style>
-            [data-testid="stSidebarNav"] {
-                background-image: url('https://github.com/tpfeeney/spirited-reviews/blob/main/srlogo.png?raw=true');
+            [data-testid="stSidebarNav"] {{
+                background-image: url('{logo}');
                 background-repeat: no-repeat;
                 background-position: 20px 20px;
                 padding-top: 180px;
-                background-size: 150px;
-            }
+                background-size: {LOGO_WIDTH}px;
+            }}
         </style>
         """,
         unsafe_allow_html=True,
     )
 
 
+def show_image(img, width=None, caption=None, alt=""):
+    """Draw an image source: a static URL as a lazy <img>, anything else (bytes) through st.image."""
+    if isinstance(img, str):
+        st.markdown(image_html(img, alt=alt or caption or "", width=width), unsafe_allow_html=True)
+        if caption:
+            st.caption(caption)
+    elif width:
+        st.image(img, width=width, caption=caption)
+    else:
+        st.image(img, use_container_width=True, caption=caption)
+
+
+# Lower bound of every label after "Pass" — must stay in step with score_label()
+SCORE_THRESHOLDS = [4, 5, 6, 7, 8, 9]
+SCORE_LABELS = [
+    "Pass", "Meh", "Baseline Bottle", "Weeknight Winner",
+    "Dependently Delicious", "Buy-It-Now!", "One for the Ages!",
+]
+
+
 def score_label(avg):
     """Official Spirited Reviews score labels — aligned with scoring sheet."""
     if pd.isna(avg):
@@ -47,55 +87,429 @@ def score_label(avg):
         return "One for the Ages!"
 
 
-@st.cache_data(ttl=3600)
-def load_data():
-    sheet_id = "1HPjovmE5GFSBUlH-EyZW2ZhteaI22lqqttLrt_ql46k"
-    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
-    df = pd.read_csv(url)
+def score_labels(avgs):
+    """Vectorized score_label over a Series of averages."""
+    if avgs.empty:
+        return avgs.copy()      # what avgs.apply(score_label) gives
+    values = avgs.to_numpy(dtype=float, na_value=np.nan)
+    labels = np.array(SCORE_LABELS, dtype=object)[np.searchsorted(SCORE_THRESHOLDS, values, side='right')]
+    labels[np.isnan(values)] = np.nan
+    return pd.Series(labels, index=avgs.index, name=avgs.name).infer_objects()
+
+
+# "12 Years", "8 year" → "12", "8"
+_YEARS_RE = re.compile(r'(?i)\s*years?\s*')
+
+
+def _by_unique(series, clean):
+    """Run a vectorized `clean` over the distinct values of `series` only, then broadcast back.
+
+    Dates, ages and prices repeat heavily, so this is far cheaper than cleaning every row.
+    """
+    codes, uniques = pd.factorize(series)
+    cleaned = clean(pd.Series(uniques))
+    values = pd.api.extensions.take(cleaned.array, codes, allow_fill=True)
+    return pd.Series(values, index=series.index, name=series.name)
 
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
-    today = pd.Timestamp.today().normalize()
-    df = df[df['date'] <= today - pd.Timedelta(days=2)]
+
+def _clean_age(ages):
+    return pd.to_numeric(
+        ages.astype(str).str.strip().str.replace(_YEARS_RE, '', regex=True).str.strip(),
+        errors='coerce',
+    ).astype(float)
+
+
+def _clean_price(prices):
+    return pd.to_numeric(
+        prices.astype(str).str.strip().str.replace(r'[\$,]', '', regex=True),
+        errors='coerce',
+    )
+
+
+REVIEWS_SNAPSHOT = "reviews"
+
+# How often the background thread re-syncs the sheet — inside the old one-hour cache TTL
+REVIEWS_REFRESH_SECONDS = 50 * 60
+
+# Shortest gap between two on-demand refreshes of the same source, across all sessions
+REFRESH_COOLDOWN_SECONDS = 30
+
+
+def clean_reviews(df):
+    """Row-wise cleaning of the raw review sheet. Safe to run on any subset of rows."""
+    rows = len(df)
+    with stage("dates", rows=rows):
+        df['date'] = _by_unique(df['date'], lambda d: pd.to_datetime(d, errors='coerce'))
 
     # Only use reviewer cols that actually exist in the sheet
     active_reviewers = [c for c in REVIEWER_COLS if c in df.columns]
-    df['avg'] = df[active_reviewers].apply(pd.to_numeric, errors='coerce').mean(axis=1, skipna=True).round(1)
-    df['score'] = df['avg'].apply(score_label)
+    with stage("average", rows=rows):
+        df['avg'] = df[active_reviewers].apply(pd.to_numeric, errors='coerce').mean(axis=1, skipna=True).round(1)
+        df['score'] = score_labels(df['avg'])
 
     # Clean age — handles "12 Years", "NAS", "12", bare numbers
-    # NAS = Non-Age Stated, a legitimate whiskey term — preserve it
-    def clean_age(val):
-        if val is None:
-            return np.nan
-        s = str(val).strip()
-        if s.upper() in ('NAS', '', 'NAN', 'NONE', 'N/A'):
-            return np.nan
-        s = re.sub(r'(?i)\s*years?\s*', '', s).strip()
-        try:
-            return float(s)
-        except ValueError:
-            return np.nan
-    import re
-    df['age'] = df['age'].apply(clean_age)
+    # NAS = Non-Age Stated, a legitimate whiskey term — anything non-numeric becomes NaN
+    with stage("age", rows=rows):
+        df['age'] = _by_unique(df['age'], _clean_age)
 
     # Clean price — handles "$45", "45", "$45.99"
-    df['price'] = (
-        df['price']
-        .astype(str)
-        .str.strip()
-        .str.replace(r'[\$,]', '', regex=True)
-        .replace({'nan': np.nan, '': np.nan})
-    )
-    df['price'] = pd.to_numeric(df['price'], errors='coerce')
+    with stage("price", rows=rows):
+        df['price'] = _by_unique(df['price'], _clean_price)
+
+    return df
+
 
-    # Sort ascending so the most recent entry appears at the bottom of the table
-    df = df.sort_values('date', ascending=True).reset_index(drop=True)
+def published_reviews(df):
+    """Drop reviews dated within the last two days and sort oldest → newest."""
+    with stage("publish") as rec:
+        today = pd.Timestamp.today().normalize()
+        df = df[df['date'] <= today - pd.Timedelta(days=2)]
 
+        # Sort ascending so the most recent entry appears at the bottom of the table
+        df = df.sort_values('date', ascending=True).reset_index(drop=True)
+        rec.set(rows=len(df))
     return df
 
 
+# ── Derived columns ───────────────────────────────────────────────────────────
+# Columns the pages used to re-derive on every rerun, computed once per dataset
+# version instead. Pages only read them.
+PROOF_BINS   = [79, 89, 94, 99, 104, 109, 114, 119, 129, 139, 149, float('inf')]
+PROOF_LABELS = ["80-89", "90-94", "95-99", "100-104", "105-109",
+                "110-114", "115-119", "120-129", "130-139", "140-149", ">=150"]
+
+
+def derive_columns(df):
+    """Add median, guest_avg, guest_median, proof_cat and date_label to the published frame, in place."""
+    reviewers = [c for c in REVIEWER_COLS if c in df.columns]
+    scores = df[reviewers].apply(pd.to_numeric, errors='coerce')
+    df['median'] = scores.median(axis=1, skipna=True).round(1)
+
+    guests = [c for c in GUEST_COLS if c in df.columns]
+    guest_scores = df[guests].apply(pd.to_numeric, errors='coerce')
+    df['guest_avg']    = guest_scores.mean(axis=1, skipna=True).round(1)
+    df['guest_median'] = guest_scores.median(axis=1, skipna=True).round(1)
+
+    df['proof'] = pd.to_numeric(df['proof'], errors='coerce')
+    df['proof_cat'] = pd.cut(df['proof'], bins=PROOF_BINS, labels=PROOF_LABELS, right=True)
+
+    # Few distinct review dates, so format each once
+    df['date_label'] = _by_unique(df['date'], lambda d: d.dt.strftime("%d %B %Y")).astype('category')
+    return df
+
+
+# ── Display formatting ────────────────────────────────────────────────────────
+def format_values(series, fmt, missing="—"):
+    """Format a numeric series as display strings, e.g. fmt="{:.1f}" or "${:.0f}".
+
+    Each distinct value is formatted once and the strings are broadcast back by
+    code, so the cost tracks the number of distinct values, not rows. Missing
+    values become `missing`.
+    """
+    codes, uniques = pd.factorize(series)
+    labels = np.array([fmt.format(float(v)) for v in uniques] + [missing], dtype=object)
+    return pd.Series(labels[codes], index=series.index, name=series.name)
+
+
+# ── Table rendering ───────────────────────────────────────────────────────────
+# Zebra striping for st.dataframe. The stripe CSS is built once per (rows, theme)
+# as one array, instead of a Python call per row on every rerun.
+TABLE_THEMES = {
+    "Dark":  {"odd": "#1a1a1a", "even": "#2a2a2a", "text": "#eeeeee"},
+    "Light": {"odd": "#ffffff", "even": "#f2efe8", "text": "#222222"},
+}
+
+# A pandas Styler is marshalled cell by cell, so past this many rows it costs
+# seconds and megabytes per render. Pages render long tables a window at a
+# time (see table_window), which keeps them under it; anything longer is sent
+# unstyled.
+STRIPE_ROW_LIMIT = 1000
+
+
+@functools.lru_cache(maxsize=64)
+def _stripe_css(n_rows, theme):
+    colors = TABLE_THEMES[theme]
+    css = np.array([
+        f"background-color: {colors['odd']}; color: {colors['text']}",
+        f"background-color: {colors['even']}; color: {colors['text']}",
+    ], dtype=object)
+    rows = css[np.arange(n_rows) % 2]
+    rows.flags.writeable = False
+    return rows
+
+
+def striped_table(df, theme, formats=None):
+    """df zebra-striped in the Dark/Light table theme, ready for st.dataframe.
+
+    df may be a DataFrame or an Arrow table. It is returned as-is when it has
+    more than STRIPE_ROW_LIMIT rows. `formats` is passed to Styler.format for
+    the styled case.
+    """
+    if len(df) > STRIPE_ROW_LIMIT:
+        return df
+    if not isinstance(df, pd.DataFrame):
+        df = df.to_pandas()
+    rows = _stripe_css(len(df), theme)
+    styles = pd.DataFrame(np.broadcast_to(rows[:, None], df.shape), index=df.index, columns=df.columns)
+    styler = df.style.apply(lambda _: styles, axis=None)
+    return styler.format(formats) if formats else styler
+
+
+# ── Arrow display tables ──────────────────────────────────────────────────────
+# Finished display tables are converted to Arrow once per dataset version and
+# shared by every session. Pages take their visible rows from them, and
+# st.dataframe sends an Arrow table without converting it again.
+def arrow_table(dataset, key, build):
+    """build(frame) → display DataFrame, cached on the dataset as a pyarrow Table."""
+    import pyarrow as pa
+
+    return dataset.memo(("arrow", key), lambda df: pa.Table.from_pandas(build(df), preserve_index=False))
+
+
+# ── Table windows ─────────────────────────────────────────────────────────────
+# Long tables are sorted, filtered and sliced on the server, and only the visible
+# page is sent to the browser. Sort orders and filter results are row positions
+# in the shared frame, computed once per dataset version.
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def table_positions(dataset, sort_by, ascending=True):
+    """Positions of the dataset's rows sorted by `sort_by`, missing values last.
+
+    Narrow them with positions_in(). The result is cached on the dataset and read-only.
+    """
+    def build(df):
+        order = df[sort_by].sort_values(ascending=ascending, kind='stable', na_position='last')
+        positions = df.index.get_indexer(order.index)
+        positions.flags.writeable = False
+        return positions
+
+    return dataset.memo(("positions", sort_by, ascending), build)
+
+
+def filter_index(dataset):
+    """The dataset's FilterIndex, with every reviewer and guest column as a "reviewer" choice."""
+    return dataset.memo("filter_index", lambda df: FilterIndex(df, reviewers=REVIEWER_COLS + GUEST_COLS))
+
+
+def positions_in(positions, rows, n_rows):
+    """The entries of `positions` that are also in `rows`, keeping their order."""
+    keep = np.zeros(n_rows, dtype=bool)
+    keep[rows] = True
+    return positions[keep[positions]]
+
+
+def table_window(key, total, default_size=50, inputs=()):
+    """Rows-per-page and page pickers for a server-side table window.
+
+    Shows which rows are on screen out of `total` and returns the (start, stop)
+    slice to render. `inputs` is whatever decides the rows (sort, filters,
+    search); when it changes, the window goes back to page 1.
+    """
+    size_col, page_col, count_col = st.columns([1, 1, 3])
+    size = size_col.selectbox("Rows per page", PAGE_SIZES, index=PAGE_SIZES.index(default_size),
+                              key=f"{key}_page_size")
+    pages = max(1, -(-total // size))
+
+    page_key, inputs_key = f"{key}_page", f"{key}_inputs"
+    if st.session_state.get(inputs_key, inputs) != inputs:
+        st.session_state[page_key] = 1
+    st.session_state[inputs_key] = inputs
+    # A new dataset version can still leave the remembered page past the end
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = page_col.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, step=1, key=page_key)
+
+    start = (page - 1) * size
+    stop = min(start + size, total)
+    count_col.caption(f"Showing {start + 1 if total else 0:,}–{stop:,} of {total:,}")
+    return start, stop
+
+
+# ── Schema ────────────────────────────────────────────────────────────────────
+# Compact dtypes for the published frame. Repeated strings become categoricals,
+# and scores fit in float32. The snapshot keeps the plain cleaned dtypes so
+# appended rows concatenate cleanly.
+CATEGORY_COLS = ['brand', 'type']
+DERIVED_SCORE_COLS = ['median', 'guest_avg', 'guest_median']
+
+
+def apply_schema(df):
+    """Cast the published frame to its compact dtypes, in place. Returns df."""
+    for col in CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    df['score'] = pd.Categorical(df['score'], categories=SCORE_LABELS, ordered=True)
+
+    for col in REVIEWER_COLS + GUEST_COLS + DERIVED_SCORE_COLS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+
+    # Whole-year ages fit a nullable small int; keep float for the odd "12.5"
+    ages = df['age'].dropna()
+    if ((ages % 1 == 0) & (ages.abs() < 2**15)).all():
+        df['age'] = df['age'].astype('Int16')
+    else:
+        df['age'] = df['age'].astype('float32')
+
+    df['date'] = df['date'].astype('datetime64[ns]')
+    return df
+
+
+def prepare_reviews(df):
+    """Cleaned snapshot frame → what pages see: published rows, derived columns, compact dtypes."""
+    df = published_reviews(df)
+    with stage("derive", rows=len(df)):
+        derive_columns(df)
+    with stage("schema", rows=len(df)) as rec:
+        apply_schema(df)
+        rec.set(bytes=df.memory_usage(deep=True).sum())
+    return df
+
+
+# Keeps the reviews snapshot in step with the sheet
+reviews_sync = SheetSync(REVIEWS_SNAPSHOT, configured_source("reviews"), clean_reviews)
+
+
+# (sheet version, publish cutoff day) → the Dataset built for it
+_published = {}
+
+
+def _publish(df):
+    """Cleaned snapshot frame → the shared, read-only Dataset pages are served from.
+
+    Reused while neither the sheet nor the two-day publish cutoff has moved, so
+    an unchanged refresh costs nothing downstream. When either moves, the frame
+    is rebuilt. If it hashes the same as the one being served (an edit to an
+    unpublished row, a new day that publishes nothing new), that Dataset is kept
+    and so is everything cached on it.
+    """
+    version = reviews_sync.version
+    key = (version, pd.Timestamp.today().normalize())
+    dataset = _published.get(key) if version is not None else None
+    if dataset is None:
+        frame = prepare_reviews(df)
+        with stage("content hash", rows=len(frame)):
+            content = content_version(frame)
+        current = next(iter(_published.values()), None)
+        dataset = current if current is not None and current.version == content else Dataset(frame, content)
+        with stage("search index", rows=len(dataset)):
+            search_index(dataset)
+        with stage("filter index", rows=len(dataset)):
+            filter_index(dataset)
+        _published.clear()
+        _published[key] = dataset
+    return dataset
+
+
+def _load_reviews():
+    """One refresh: sync the sheet and publish it, with every stage timed."""
+    with trace("reviews"):
+        return _publish(reviews_sync.sync())
+
+
+def _cached_reviews():
+    """Last synced reviews and their age, served while the first refresh runs."""
+    with trace("reviews", kind="snapshot"):
+        with stage("read snapshot") as rec:
+            df = reviews_sync.current()
+            rec.set(rows=0 if df is None else len(df))
+        return (None, None) if df is None else (_publish(df), reviews_sync.synced_age)
+
+
+reviews_refresher = BackgroundRefresher(
+    "reviews",
+    _load_reviews,
+    interval=REVIEWS_REFRESH_SECONDS,
+    initial=_cached_reviews,
+)
+
+
+# ── Per-source refresh ────────────────────────────────────────────────────────
+# source name → (times refreshed on demand, time.time() of the last refresh)
+_source_versions = {}
+_source_lock = threading.Lock()
+
+
+def source_version(name):
+    """How often `name` has been refreshed on demand.
+
+    Cached loaders take it as an argument, so a refresh only misses their own
+    entries instead of clearing every st.cache_data function for every session.
+    """
+    return _source_versions.get(name, (0, None))[0]
+
+
+def bump_source(name, cooldown=REFRESH_COOLDOWN_SECONDS):
+    """Invalidate `name` for every session, at most once per `cooldown` seconds.
+
+    Returns 0 if it was bumped, else the seconds left before it can be again.
+    """
+    with _source_lock:
+        version, bumped_at = _source_versions.get(name, (0, None))
+        now = time.time()
+        if bumped_at is not None and now - bumped_at < cooldown:
+            return cooldown - (now - bumped_at)
+        _source_versions[name] = (version + 1, now)
+        return 0
+
+
+def load_dataset():
+    """The process-wide reviews Dataset. Never waits on the sheet once any copy has been loaded."""
+    return reviews_refresher.get()
+
+
+def load_data():
+    """A fresh zero-copy view of the current reviews frame."""
+    return load_dataset().view()
+
+
+def refresh_data():
+    """Re-sync the reviews now and unpin this session's dataset so the next get_data() sees it.
+
+    Only the reviews are touched; the new Dataset brings its own derived tables
+    and indexes. Rate-limited like bump_source(), whose return value it passes on.
+    """
+    wait = bump_source("reviews")
+    if not wait and not reviews_refresher.refresh():
+        # The last good copy is still served; refresh_button() says so after the rerun
+        st.session_state.refresh_error = reviews_refresher.last_error
+    st.session_state.pop("dataset", None)
+    return wait
+
+
+def refresh_button(refresh=refresh_data, on_refresh=None):
+    """The sidebar "Refresh Data" button.
+
+    Calls `refresh` (refresh_data() or a bump_source() call) when clicked. If it
+    is still cooling down, says how long to wait; otherwise calls `on_refresh`,
+    if given, and reruns the page. A failed refresh_data() is reported after the rerun.
+    """
+    error = st.session_state.pop("refresh_error", None)
+    if error:
+        st.sidebar.warning(f"Refresh failed — still showing the last good data. {error}")
+    if not st.sidebar.button("🔄 Refresh Data"):
+        return
+    wait = refresh()
+    if wait:
+        st.sidebar.caption(f"Just refreshed — try again in {wait:.0f}s.")
+        return
+    if on_refresh is not None:
+        on_refresh()
+    st.rerun()
+
+
+def get_dataset():
+    """The Dataset this session is pinned to, pinning the current one on first use."""
+    if "dataset" not in st.session_state:
+        st.session_state.dataset = load_dataset()
+    return st.session_state.dataset
+
+
 def get_data():
-    """Load data into session state if not already present, then return it."""
-    if "df" not in st.session_state:
-        st.session_state.df = load_data()
-    return st.session_state.df
\ No newline at end of file
+    """A fresh view of this session's dataset (see get_dataset).
+
+    Every call returns a new view, so a page can add or convert columns without
+    touching the shared frame or other pages' views.
+    """
+    return get_dataset().view()
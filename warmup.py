@@ -0,0 +1,163 @@
+"""Boot-time warm-up of the process-wide caches.
+
+The first visitor after a deploy or restart used to pay for the sheet fetch,
+the parse, every page's imports and the first table builds. start() runs all
+of that on a background thread as soon as the server process boots.
+status() reports progress. The /ready route in server.py answers 503 until
+the warm-up is done, so a health check only routes traffic to a warm process.
+
+Steps run in registration order. A failing step is logged and recorded, and
+the rest still run. Only a failing required step (the reviews) keeps the
+process from reporting ready. Since an unready process gets no traffic that
+could load the data instead, failed steps are retried with backoff until
+every required step has succeeded.
+"""
+import importlib
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# Libraries the pages import lazily; loading them here keeps the cost off first renders
+PAGE_IMPORTS = [
+    "matplotlib.pyplot", "seaborn", "plotly.express", "plotly.graph_objects",
+    "scipy.stats", "sklearn.linear_model",
+]
+
+RETRY_SECONDS = 5
+MAX_RETRY_SECONDS = 300
+
+_steps = []         # (name, fn, required)
+_status = {"started_at": None, "finished_at": None, "steps": []}
+_lock = threading.Lock()
+_thread = None
+_finished = threading.Event()   # set once every step has run once
+
+
+def step(name, required=False):
+    """Register the decorated zero-arg function as a warm-up step."""
+    def register(fn):
+        _steps.append((name, fn, required))
+        return fn
+    return register
+
+
+# ── Steps ────────────────────────────────────────────────────────────────────
+@step("reviews", required=True)
+def _reviews():
+    from utils import load_dataset, table_positions
+
+    # Syncs (or seeds from the snapshot) and publishes, building the search and filter indexes
+    dataset = load_dataset()
+    # Default order of the main table and the reviewer picker
+    table_positions(dataset, "date", ascending=False)
+
+
+@step("display tables")
+def _display_tables():
+    from tables import brand_averages, guest_table, reviews_table
+    from utils import load_dataset, REVIEWER_COLS
+
+    dataset = load_dataset()
+    reviews_table(dataset)
+    guest_table(dataset)
+    # Distillery Ranks as it first opens: every brand and type, Overall plus each reviewer
+    columns = dataset.view().columns
+    brand_averages(dataset, ["avg"] + [c for c in REVIEWER_COLS if c in columns])
+
+
+@step("barrel picks")
+def _barrel_picks():
+    from barrel_picks import load_barrel_picks
+    from utils import source_version
+
+    load_barrel_picks(source_version("barrel_picks"))
+
+
+@step("pick images")
+def _pick_images():
+    from barrel_picks import load_barrel_picks
+    from image_assets import variant_url
+    from image_cache import image_names, load_images
+    from utils import source_version
+
+    # Labels without a pre-resized variant are fetched by the page; pull them into the image cache
+    picks = load_barrel_picks(source_version("barrel_picks"))
+    names = {str(f).strip() for f in picks.get("image_file", [])} - {"", "nan", "None"}
+    load_images([f for f in names if not any(variant_url(n, 0) for n in image_names(f))])
+
+
+@step("page imports")
+def _page_imports():
+    for module in PAGE_IMPORTS:
+        importlib.import_module(module)
+
+
+# ── Running ──────────────────────────────────────────────────────────────────
+def start():
+    """Start the warm-up in the background, once per process."""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _status["started_at"] = time.time()
+            _thread = threading.Thread(target=_run, name="warmup", daemon=True)
+            _thread.start()
+
+
+def wait(timeout=None):
+    """Block until every step has run once. Returns whether the process is ready."""
+    if _thread is not None:
+        _finished.wait(timeout)
+    return status()["ready"]
+
+
+def _run():
+    failed = _run_steps(_steps)
+    with _lock:
+        _status["finished_at"] = time.time()
+    log.info("Warm-up finished in %.1f s", _status["finished_at"] - _status["started_at"])
+    _finished.set()
+
+    delay = RETRY_SECONDS
+    while any(required for _, _, required in failed):
+        log.info("Retrying failed warm-up steps in %d s", delay)
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_RETRY_SECONDS)
+        failed = _run_steps(failed)
+
+
+def _run_steps(steps):
+    """Run `steps`, recording each outcome in place of any earlier one. Returns the ones that failed."""
+    failed = []
+    for name, fn, required in steps:
+        record = {"step": name, "required": required, "error": None}
+        t0 = time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            log.warning("Warm-up step %s failed: %s", name, e)
+            failed.append((name, fn, required))
+        record["seconds"] = round(time.perf_counter() - t0, 3)
+        with _lock:
+            earlier = next((s for s in _status["steps"] if s["step"] == name), None)
+            record["attempts"] = 1 if earlier is None else earlier["attempts"] + 1
+            if earlier is None:
+                _status["steps"].append(record)
+            else:
+                earlier.update(record)
+    return failed
+
+
+def status():
+    """Progress of the warm-up; `ready` once every required step has succeeded, retries included."""
+    with _lock:
+        steps = [dict(s) for s in _status["steps"]]
+        finished = _status["finished_at"] is not None
+        return {
+            "ready": finished and not any(s["required"] and s["error"] for s in steps),
+            "started_at": _status["started_at"],
+            "finished_at": _status["finished_at"],
+            "steps": steps,
+        }